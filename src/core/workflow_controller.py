@@ -603,12 +603,13 @@ class WorkflowController:
             
         except Exception as e:
             logger.error(f"❌ Error handling scheduled task {scheduled_task.video_id}: {e}")
-            # Mark as failed
-            update_video_status(scheduled_task.video_id, "failed")
             
             # Remove from active jobs
             if scheduled_task.video_id in self.active_jobs:
                 del self.active_jobs[scheduled_task.video_id]
+            
+            # The scheduler's lifecycle wrapper marks the video failed
+            raise
     
     async def schedule_video_for_processing(self, video_data: Dict[str, Any]) -> bool:
         """
@@ -1,9 +1,21 @@
 import sqlite3
 import json
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj):
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
 # Database configuration
 DB_PATH = "videos.db"
 
@@ -35,22 +47,37 @@ def init_db():
     )
     """)
     
+    # Index for the scheduler's "due pending videos" poll
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_videos_status_schedule
+    ON videos (status, schedule_time)
+    """)
+    
+    # Create form drafts table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS drafts (
+        id TEXT PRIMARY KEY,
+        payload TEXT NOT NULL,
+        saved_at REAL NOT NULL
+    )
+    """)
+    
     conn.commit()
     conn.close()
     print("✅ Database initialized successfully!")
 
-def save_video(data: dict):
-    """Save form data into the database."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("""
-    INSERT INTO videos (
-        title, description, captions, tags, video_url, genre,
-        expected_length, schedule_time, platforms, video_type,
-        music_pref, channel_name, extra_metadata, status
-    )
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+_INSERT_VIDEO_SQL = """
+INSERT INTO videos (
+    title, description, captions, tags, video_url, genre,
+    expected_length, schedule_time, platforms, video_type,
+    music_pref, channel_name, extra_metadata, status
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def _video_row(data: dict):
+    """Convert form data into a row tuple for _INSERT_VIDEO_SQL."""
+    return (
         data.get("title"),
         data.get("description"),
         data.get("captions"),
@@ -63,9 +90,15 @@ def save_video(data: dict):
         data.get("video_type"),
         data.get("music_pref"),
         data.get("channel_name"),
-        json.dumps(data.get("extra_metadata", {})),
+        _dumps(data.get("extra_metadata", {})),
         "pending"  # Default status
-    ))
+    )
+
+def save_video(data: dict):
+    """Save form data into the database."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(_INSERT_VIDEO_SQL, _video_row(data))
     
     # Get the inserted video ID
     video_id = cursor.lastrowid
@@ -76,6 +109,43 @@ def save_video(data: dict):
     print(f"✅ Video saved successfully with ID: {video_id}")
     return video_id
 
+def save_videos_bulk(rows: list):
+    """Save several form submissions in a single transaction."""
+    if not rows:
+        return 0
+    
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.executemany(_INSERT_VIDEO_SQL, [_video_row(data) for data in rows])
+    saved_count = cursor.rowcount
+    
+    conn.commit()
+    conn.close()
+    
+    print(f"✅ Saved {saved_count} videos in one batch")
+    return saved_count
+
+def save_draft(draft_id: str, data: dict):
+    """Save (or replace) a form draft."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute(
+        "INSERT OR REPLACE INTO drafts (id, payload, saved_at) VALUES (?, ?, ?)",
+        (draft_id, _dumps(data), datetime.now().timestamp())
+    )
+    conn.commit()
+    conn.close()
+
+def load_draft(draft_id: str):
+    """Get a saved form draft, or None if there is none."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute("SELECT payload FROM drafts WHERE id = ?", (draft_id,)).fetchone()
+    conn.close()
+    
+    if row:
+        return json.loads(row[0])
+    
+    return None
+
 def get_pending_videos():
     """Get all pending videos from the database."""
     conn = sqlite3.connect(DB_PATH)
@@ -193,7 +263,7 @@ def update_video(video_id: int, data: dict):
             if key in ['tags', 'platforms'] and isinstance(value, list):
                 values.append(",".join(value))
             elif key == 'extra_metadata':
-                values.append(json.dumps(value))
+                values.append(_dumps(value))
             else:
                 values.append(value)
     
@@ -213,6 +283,28 @@ def update_video(video_id: int, data: dict):
         print(f"❌ No valid fields to update for video {video_id}")
         return False
 
+def _parse_schedule_time(value):
+    """Parse a stored schedule_time string into a datetime once, at fetch time.
+    
+    schedule_time is naive local time, so SQL compares it against datetime('now', 'localtime').
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+def _parse_metadata(value):
+    """Decode a stored extra_metadata JSON string into a dict once, at fetch time."""
+    if not value:
+        return {}
+    try:
+        metadata = json.loads(value)
+    except ValueError:
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
 def get_scheduled_videos():
     """Get all videos that are scheduled for processing."""
     conn = sqlite3.connect(DB_PATH)
@@ -225,7 +317,7 @@ def get_scheduled_videos():
     FROM videos 
     WHERE status = 'pending' 
     AND schedule_time IS NOT NULL 
-    AND schedule_time <= datetime('now', '+1 hour')
+    AND schedule_time <= datetime('now', 'localtime', '+1 hour')
     ORDER BY schedule_time ASC
     """)
     
@@ -234,12 +326,7 @@ def get_scheduled_videos():
     
     for row in cursor.fetchall():
         video_dict = dict(zip(columns, row))
-        # Parse schedule_time string to datetime
-        if video_dict['schedule_time']:
-            try:
-                video_dict['schedule_time'] = datetime.fromisoformat(video_dict['schedule_time'])
-            except:
-                video_dict['schedule_time'] = None
+        video_dict['schedule_time'] = _parse_schedule_time(video_dict['schedule_time'])
         videos.append(video_dict)
     
     conn.close()
@@ -257,7 +344,7 @@ def get_videos_ready_for_processing():
     FROM videos 
     WHERE status = 'pending' 
     AND schedule_time IS NOT NULL 
-    AND schedule_time <= datetime('now')
+    AND schedule_time <= datetime('now', 'localtime')
     ORDER BY schedule_time ASC
     """)
     
@@ -266,17 +353,130 @@ def get_videos_ready_for_processing():
     
     for row in cursor.fetchall():
         video_dict = dict(zip(columns, row))
-        # Parse schedule_time string to datetime
-        if video_dict['schedule_time']:
-            try:
-                video_dict['schedule_time'] = datetime.fromisoformat(video_dict['schedule_time'])
-            except:
-                video_dict['schedule_time'] = None
+        video_dict['schedule_time'] = _parse_schedule_time(video_dict['schedule_time'])
         videos.append(video_dict)
     
     conn.close()
     return videos
 
+_poll_local = threading.local()
+# Every thread's poll connection, so close_poll_connections can reach them from any thread
+_poll_connections = set()
+_poll_lock = threading.Lock()
+
+def _poll_connection():
+    """Return this thread's long-lived autocommit connection for the scheduler's poll queries.
+    
+    sqlite3 caches compiled statements per connection, so reusing it skips re-preparing the same SQL every tick.
+    """
+    conn = getattr(_poll_local, "conn", None)
+    if conn is None or _poll_local.path != DB_PATH or conn not in _poll_connections:
+        with _poll_lock:
+            if conn is not None and conn in _poll_connections:
+                _poll_connections.discard(conn)
+                conn.close()
+            # Only ever used by this thread, but close_poll_connections may close it from another
+            conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+            _poll_connections.add(conn)
+        _poll_local.conn, _poll_local.path = conn, DB_PATH
+    return conn
+
+def close_poll_connections():
+    """Close every thread's poll connection; threads that poll again get a fresh one."""
+    with _poll_lock:
+        connections = list(_poll_connections)
+        _poll_connections.clear()
+    for conn in connections:
+        conn.close()
+
+def claim_ready_videos(limit: int):
+    """Atomically move up to limit due pending videos to 'uploading' and return them.
+    
+    BEGIN IMMEDIATE takes the write lock before the SELECT, so concurrent schedulers never claim the same video.
+    """
+    conn = _poll_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("""
+        SELECT id, title, description, genre, expected_length, schedule_time, 
+               platforms, video_type, music_pref, channel_name, extra_metadata, status,
+               video_url, created_at, updated_at
+        FROM videos 
+        WHERE status = 'pending' 
+        AND schedule_time IS NOT NULL 
+        AND schedule_time <= datetime('now', 'localtime')
+        ORDER BY schedule_time ASC
+        LIMIT ?
+        """, (limit,))
+        
+        columns = [description[0] for description in cursor.description]
+        videos = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        
+        if videos:
+            cursor.execute(f"""
+            UPDATE videos 
+            SET status = 'uploading', updated_at = CURRENT_TIMESTAMP
+            WHERE id IN ({','.join('?' * len(videos))})
+            """, [video['id'] for video in videos])
+        
+        cursor.execute("COMMIT")
+    except BaseException:
+        # The connection is reused, so never leave it inside a transaction
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    
+    for video in videos:
+        video['schedule_time'] = _parse_schedule_time(video['schedule_time'])
+        video['extra_metadata'] = _parse_metadata(video['extra_metadata'])
+        video['status'] = 'uploading'
+    
+    return videos
+
+def get_upcoming_videos():
+    """Get id, title and schedule_time of every pending scheduled video, earliest first."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+    SELECT id, title, schedule_time
+    FROM videos 
+    WHERE status = 'pending' 
+    AND schedule_time IS NOT NULL
+    ORDER BY schedule_time ASC
+    """)
+    
+    videos = [
+        {'id': video_id, 'title': title, 'schedule_time': _parse_schedule_time(schedule_time)}
+        for video_id, title, schedule_time in cursor.fetchall()
+    ]
+    
+    conn.close()
+    return videos
+
+def get_next_scheduled_time():
+    """Get the earliest schedule_time among pending videos, or None if there are none."""
+    row = _poll_connection().execute("""
+    SELECT MIN(schedule_time)
+    FROM videos 
+    WHERE status = 'pending' 
+    AND schedule_time IS NOT NULL
+    """).fetchone()
+    
+    return _parse_schedule_time(row[0])
+
+def open_change_watch():
+    """Open a long-lived connection for get_data_version; its counter only tracks commits made elsewhere."""
+    return sqlite3.connect(DB_PATH, check_same_thread=False)
+
+def get_data_version(conn) -> int:
+    """Return SQLite's data_version for conn, which changes whenever another connection commits."""
+    return conn.execute("PRAGMA data_version").fetchone()[0]
+
 def get_video_processing_stats():
     """Get statistics about video processing."""
     conn = sqlite3.connect(DB_PATH)
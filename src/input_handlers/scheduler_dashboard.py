@@ -4,13 +4,17 @@ Streamlit interface to monitor and control the automated video generation schedu
 """
 
 import streamlit as st
+import pandas as pd
 import asyncio
 import sys
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
+from dateutil.parser import isoparse
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+_PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 from src.database.db_handler import (
     get_all_videos, 
@@ -18,10 +22,69 @@ from src.database.db_handler import (
     get_scheduled_videos,
     get_videos_ready_for_processing,
     update_video_status,
-    get_video_by_id
+    get_video_by_id,
+    open_change_watch,
+    get_data_version
 )
 from src.core.workflow_controller import WorkflowController, start_workflow, stop_workflow, get_workflow_status
 
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
+
+# Status groupings used to split the video list into dashboard sections
+_PROCESSING_STATUSES = frozenset(('image_generation', 'video_assembly', 'uploading'))
+_DONE_STATUSES = frozenset(('completed', 'failed', 'cancelled'))
+
+# Status display lookups (built once at import instead of per video/group on every rerun)
+_PROCESSING_HEADER = {
+    'image_generation': ('🖼️', '🖼️ Generating Images (SKIPPED)'),
+    'video_assembly': ('🎬', '🎬 Assembling Video (SKIPPED)'),
+    'uploading': ('📤', '📤 Uploading to YouTube')
+}
+
+_STATUS_HEADER = {
+    'completed': ('✅', '✅ Successfully Completed'),
+    'failed': ('❌', '❌ Processing Failed'),
+    'cancelled': ('⏹️', '⏹️ Processing Cancelled')
+}
+
+_TABLE_COLUMNS = ['id', 'title', 'genre', 'expected_length', 'status', 'created_at', 'updated_at', 'video_type']
+
+def _parse_timestamp(value):
+    """Return a DB timestamp as a datetime, or None if it is missing or malformed"""
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        return None
+    try:
+        return isoparse(value)
+    except ValueError:
+        return None
+
+@st.cache_resource(show_spinner=False)
+def _get_change_watch():
+    """Long-lived connection whose data_version changes whenever the database is written elsewhere"""
+    return open_change_watch()
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _fetch_videos(data_version):
+    """Fetch all videos with display-only fields precomputed once per fetch; data_version only keys the cache"""
+    videos = get_all_videos()
+    for video in videos:
+        description = video.get('description') or ''
+        video['description_preview'] = description[:100] + ('...' if len(description) > 100 else '')
+    return videos
+
+def _get_all_videos():
+    """All videos, refetched only after a commit (scheduler, UI or this dashboard) changed the database"""
+    return _fetch_videos(get_data_version(_get_change_watch()))
+
+def _videos_table(videos):
+    """Build the summary table for a group of videos"""
+    return pd.DataFrame(videos, columns=_TABLE_COLUMNS)
+
 def scheduler_dashboard():
     """Main scheduler dashboard interface"""
     
@@ -229,6 +292,13 @@ def scheduler_dashboard():
         st.session_state.dashboard_auto_refresh = auto_refresh
         st.rerun()
     
+    # Timer-driven rerun aligned with the 30s video cache TTL
+    if auto_refresh and st.session_state.scheduler_running:
+        if st_autorefresh is not None:
+            st_autorefresh(interval=30000, limit=None, key="sched_refresh")
+        else:
+            st.sidebar.caption("Install streamlit-autorefresh to enable timed refresh")
+    
     # Manual refresh button
     if st.sidebar.button("🔄 Manual Refresh"):
         st.session_state.dashboard_last_refresh = datetime.now()
@@ -434,9 +504,11 @@ def scheduler_dashboard():
                     st.subheader("🔄 Currently Processing Jobs")
                     for job in active_jobs:
                         with st.expander(f"🎬 {job['title']} (ID: {job['video_id']})", expanded=False):
-                            st.write(f"**Status:** {job['progress']}")
-                            st.write(f"**Video ID:** {job['video_id']}")
-                            st.write(f"**Title:** {job['title']}")
+                            st.markdown(
+                                f"**Status:** {job['progress']}  \n"
+                                f"**Video ID:** {job['video_id']}  \n"
+                                f"**Title:** {job['title']}"
+                            )
                             
                             # Progress indicator
                             if "Generating Images" in job['progress']:
@@ -463,7 +535,7 @@ def scheduler_dashboard():
     st.markdown("*Videos scheduled to be processed in the future*")
     
     try:
-        all_videos = get_all_videos()
+        all_videos = _get_all_videos()
         pending_videos = []
         upcoming_videos = []
         
@@ -474,7 +546,7 @@ def scheduler_dashboard():
                 try:
                     # Parse schedule time
                     if isinstance(video['schedule_time'], str):
-                        schedule_time = datetime.fromisoformat(video['schedule_time'].replace('Z', '+00:00'))
+                        schedule_time = isoparse(video['schedule_time'])
                     else:
                         schedule_time = video['schedule_time']
                     
@@ -521,17 +593,21 @@ def scheduler_dashboard():
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        st.write(f"**ID:** {video['id']}")
-                        st.write(f"**Description:** {video['description'][:100]}...")
-                        st.write(f"**Genre:** {video['genre']}")
-                        st.write(f"**Expected Length:** {video['expected_length']} seconds")
-                        st.write(f"**Platforms:** {video['platforms']}")
+                        st.markdown(
+                            f"**ID:** {video['id']}  \n"
+                            f"**Description:** {video['description_preview']}  \n"
+                            f"**Genre:** {video['genre']}  \n"
+                            f"**Expected Length:** {video['expected_length']} seconds  \n"
+                            f"**Platforms:** {video['platforms']}"
+                        )
                     
                     with col2:
-                        st.write(f"**Schedule Time:** {schedule_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                        st.write(f"**Time Until Processing:** {time_display}")
-                        st.write(f"**Created:** {video['created_at']}")
-                        st.write(f"**Video Type:** {video['video_type']}")
+                        st.markdown(
+                            f"**Schedule Time:** {schedule_time.strftime('%Y-%m-%d %H:%M:%S')}  \n"
+                            f"**Time Until Processing:** {time_display}  \n"
+                            f"**Created:** {video['created_at']}  \n"
+                            f"**Video Type:** {video['video_type']}"
+                        )
                         
                         # Countdown timer
                         st.info(f"⏳ Will be processed in: {time_display}")
@@ -561,17 +637,21 @@ def scheduler_dashboard():
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        st.write(f"**ID:** {video['id']}")
-                        st.write(f"**Description:** {video['description'][:100]}...")
-                        st.write(f"**Genre:** {video['genre']}")
-                        st.write(f"**Expected Length:** {video['expected_length']} seconds")
-                        st.write(f"**Platforms:** {video['platforms']}")
+                        st.markdown(
+                            f"**ID:** {video['id']}  \n"
+                            f"**Description:** {video['description_preview']}  \n"
+                            f"**Genre:** {video['genre']}  \n"
+                            f"**Expected Length:** {video['expected_length']} seconds  \n"
+                            f"**Platforms:** {video['platforms']}"
+                        )
                     
                     with col2:
-                        st.write(f"**Schedule Time:** {schedule_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                        st.write(f"**Status:** Ready for processing")
-                        st.write(f"**Created:** {video['created_at']}")
-                        st.write(f"**Video Type:** {video['video_type']}")
+                        st.markdown(
+                            f"**Schedule Time:** {schedule_time.strftime('%Y-%m-%d %H:%M:%S')}  \n"
+                            f"**Status:** Ready for processing  \n"
+                            f"**Created:** {video['created_at']}  \n"
+                            f"**Video Type:** {video['video_type']}"
+                        )
                         
                         st.success("🚀 This video is ready to be processed now!")
                         
@@ -599,41 +679,32 @@ def scheduler_dashboard():
     st.markdown("*Videos currently being generated, assembled, or uploaded*")
     
     try:
-        processing_videos = [v for v in all_videos if v['status'] in ['image_generation', 'video_assembly', 'uploading']]
+        processing_videos = [v for v in all_videos if v['status'] in _PROCESSING_STATUSES]
         
         if processing_videos:
             st.info(f"🔄 Found {len(processing_videos)} videos currently being processed")
             
             for video in processing_videos:
-                status_icons = {
-                    'image_generation': '🖼️',
-                    'video_assembly': '🎬',
-                    'uploading': '📤'
-                }
-                
-                status_icons_text = {
-                    'image_generation': '🖼️ Generating Images (SKIPPED)',
-                    'video_assembly': '🎬 Assembling Video (SKIPPED)',
-                    'uploading': '📤 Uploading to YouTube'
-                }
-                
-                status_icon = status_icons.get(video['status'], '⚪')
-                status_text = status_icons_text.get(video['status'], 'Processing')
+                status_icon, status_text = _PROCESSING_HEADER.get(video['status'], ('⚪', 'Processing'))
                 
                 with st.expander(f"{status_icon} {video['title']} - {status_text}", expanded=False):
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        st.write(f"**ID:** {video['id']}")
-                        st.write(f"**Description:** {video['description'][:100]}...")
-                        st.write(f"**Genre:** {video['genre']}")
-                        st.write(f"**Expected Length:** {video['expected_length']} seconds")
+                        st.markdown(
+                            f"**ID:** {video['id']}  \n"
+                            f"**Description:** {video['description_preview']}  \n"
+                            f"**Genre:** {video['genre']}  \n"
+                            f"**Expected Length:** {video['expected_length']} seconds"
+                        )
                     
                     with col2:
-                        st.write(f"**Status:** {status_icon} {status_text}")
-                        st.write(f"**Created:** {video['created_at']}")
-                        st.write(f"**Updated:** {video['updated_at']}")
-                        st.write(f"**Video Type:** {video['video_type']}")
+                        st.markdown(
+                            f"**Status:** {status_icon} {status_text}  \n"
+                            f"**Created:** {video['created_at']}  \n"
+                            f"**Updated:** {video['updated_at']}  \n"
+                            f"**Video Type:** {video['video_type']}"
+                        )
                         
                         # Progress indicator with better visual feedback
                         if video['status'] == 'image_generation':
@@ -647,19 +718,12 @@ def scheduler_dashboard():
                             st.progress(0.75, text="75% - YouTube Upload")
                         
                         # Show processing time
-                        if 'updated_at' in video and video['updated_at']:
-                            try:
-                                if isinstance(video['updated_at'], str):
-                                    updated_time = datetime.fromisoformat(video['updated_at'].replace('Z', '+00:00'))
-                                else:
-                                    updated_time = video['updated_at']
-                                
-                                processing_duration = current_time - updated_time
-                                if processing_duration.total_seconds() > 0:
-                                    minutes = int(processing_duration.total_seconds() // 60)
-                                    st.write(f"**Processing Duration:** {minutes} minutes")
-                            except:
-                                pass
+                        updated_time = _parse_timestamp(video.get('updated_at'))
+                        if updated_time:
+                            processing_duration = current_time - updated_time
+                            if processing_duration.total_seconds() > 0:
+                                minutes = int(processing_duration.total_seconds() // 60)
+                                st.write(f"**Processing Duration:** {minutes} minutes")
                         
                         # Automated processing info
                         st.success("🤖 **Fully Automated Processing**")
@@ -686,7 +750,7 @@ def scheduler_dashboard():
     st.markdown("*Videos that have finished processing, failed, or were cancelled*")
     
     try:
-        completed_videos = [v for v in all_videos if v['status'] in ['completed', 'failed', 'cancelled']]
+        completed_videos = [v for v in all_videos if v['status'] in _DONE_STATUSES]
         
         if completed_videos:
             # Group by status
@@ -699,75 +763,71 @@ def scheduler_dashboard():
             
             # Display by status
             for status, videos in status_groups.items():
-                status_icons = {
-                    'completed': '✅',
-                    'failed': '❌',
-                    'cancelled': '⏹️'
-                }
-                
-                status_icons_text = {
-                    'completed': '✅ Successfully Completed',
-                    'failed': '❌ Processing Failed',
-                    'cancelled': '⏹️ Processing Cancelled'
-                }
-                
-                status_icon = status_icons.get(status, '⚪')
-                status_text = status_icons_text.get(status, status.replace('_', ' ').title())
+                status_icon, status_text = _STATUS_HEADER.get(status) or ('⚪', status.replace('_', ' ').title())
                 
                 st.subheader(f"{status_icon} {status_text} Videos ({len(videos)})")
                 
-                for video in videos:
-                    with st.expander(f"{status_icon} {video['title']} - {status_text}", expanded=False):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.write(f"**ID:** {video['id']}")
-                            st.write(f"**Description:** {video['description'][:100]}...")
-                            st.write(f"**Genre:** {video['genre']}")
-                            st.write(f"**Expected Length:** {video['expected_length']} seconds")
+                # One table per group; full details only for the row the user opens
+                st.dataframe(_videos_table(videos), hide_index=True, use_container_width=True)
+                
+                with st.expander(f"🔍 {status_text} Video Details", expanded=False):
+                    videos_by_id = {video['id']: video for video in videos}
+                    selected_id = st.selectbox(
+                        "Select video",
+                        list(videos_by_id),
+                        format_func=lambda video_id: f"{video_id} - {videos_by_id[video_id]['title']}",
+                        key=f"completed_detail_{status}"
+                    )
+                    video = videos_by_id[selected_id]
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown(
+                            f"**ID:** {video['id']}  \n"
+                            f"**Description:** {video['description_preview']}  \n"
+                            f"**Genre:** {video['genre']}  \n"
+                            f"**Expected Length:** {video['expected_length']} seconds"
+                        )
+                    
+                    with col2:
+                        st.markdown(
+                            f"**Status:** {status_icon} {status_text}  \n"
+                            f"**Created:** {video['created_at']}  \n"
+                            f"**Updated:** {video['updated_at']}  \n"
+                            f"**Video Type:** {video['video_type']}"
+                        )
                         
-                        with col2:
-                            st.write(f"**Status:** {status_icon} {status_text}")
-                            st.write(f"**Created:** {video['created_at']}")
-                            st.write(f"**Updated:** {video['updated_at']}")
-                            st.write(f"**Video Type:** {video['video_type']}")
+                        # Status-specific information and actions
+                        if status == 'completed':
+                            st.success("✅ Video processing completed successfully!")
+                            st.info("🎉 Video has been uploaded to YouTube")
                             
-                            # Status-specific information and actions
-                            if status == 'completed':
-                                st.success("✅ Video processing completed successfully!")
-                                st.info("🎉 Video has been uploaded to YouTube")
-                                
-                                # Show completion time
-                                if 'updated_at' in video and video['updated_at']:
-                                    try:
-                                        if isinstance(video['updated_at'], str):
-                                            completion_time = datetime.fromisoformat(video['updated_at'].replace('Z', '+00:00'))
-                                        else:
-                                            completion_time = video['updated_at']
-                                        st.write(f"**Completed At:** {completion_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                                    except:
-                                        pass
-                                
-                            elif status == 'failed':
-                                st.error("❌ Video processing failed")
-                                st.warning("🔍 Check logs for error details")
-                                
-                                # Automated retry info
-                                st.info("🤖 **Automatic Retry System**")
-                                st.info("💡 Failed videos will be automatically retried by the system")
-                                
-                                # Show retry count if available
-                                if 'retry_count' in video.get('extra_metadata', {}):
-                                    retry_count = video['extra_metadata']['retry_count']
-                                    st.write(f"**Retry Attempts:** {retry_count}/3")
-                                
-                            elif status == 'cancelled':
-                                st.warning("⏹️ Video processing was cancelled")
-                                st.info("📝 Video can be restarted if needed")
-                                
-                                # Automated restart info
-                                st.info("🤖 **Automatic Restart System**")
-                                st.info("💡 Cancelled videos can be automatically restarted by the system")
+                            # Show completion time
+                            completion_time = _parse_timestamp(video.get('updated_at'))
+                            if completion_time:
+                                st.write(f"**Completed At:** {completion_time:%Y-%m-%d %H:%M:%S}")
+                            
+                        elif status == 'failed':
+                            st.error("❌ Video processing failed")
+                            st.warning("🔍 Check logs for error details")
+                            
+                            # Automated retry info
+                            st.info("🤖 **Automatic Retry System**")
+                            st.info("💡 Failed videos will be automatically retried by the system")
+                            
+                            # Show retry count if available
+                            if 'retry_count' in video.get('extra_metadata', {}):
+                                retry_count = video['extra_metadata']['retry_count']
+                                st.write(f"**Retry Attempts:** {retry_count}/3")
+                            
+                        elif status == 'cancelled':
+                            st.warning("⏹️ Video processing was cancelled")
+                            st.info("📝 Video can be restarted if needed")
+                            
+                            # Automated restart info
+                            st.info("🤖 **Automatic Restart System**")
+                            st.info("💡 Cancelled videos can be automatically restarted by the system")
         else:
             st.info("📭 No completed videos found")
             
@@ -784,15 +844,16 @@ def scheduler_dashboard():
         
         # Placeholder for real-time updates
         col1, col2, col3 = st.columns(3)
+        now = datetime.now()
         
         with col1:
-            st.metric("Last Check", datetime.now().strftime("%H:%M:%S"))
+            st.metric("Last Check", now.strftime("%H:%M:%S"))
         
         with col2:
             st.metric("System Uptime", "Running")
         
         with col3:
-            st.metric("Next Check", (datetime.now() + timedelta(seconds=30)).strftime("%H:%M:%S"))
+            st.metric("Next Check", (now + timedelta(seconds=30)).strftime("%H:%M:%S"))
     else:
         st.warning("⚠️ Enable real-time monitoring by starting the Automated Processing system")
     
@@ -5,37 +5,245 @@ import json
 from datetime import datetime, timedelta
 import sys
 import os
+import stat
+import shutil
 import time
+import uuid
 from pathlib import Path
 
 # Add the src directory to the path to import database modules
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+_PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
-from src.database.db_handler import save_video, init_db, delete_all_videos
+from src.database.db_handler import save_video, save_videos_bulk, save_draft, load_draft, init_db, delete_all_videos
 from src.database.db_init import init_database
+from src.utils.text_improver import TextImprover
+from src.utils.ai_cache import UncachedResult, cached_call
 
-def video_input_form():
-    st.title("🎬 AI Video Creation Form")
-    
-    # Initialize session state for form persistence
-    if 'form_last_save' not in st.session_state:
-        st.session_state.form_last_save = None
-    
-    if 'form_auto_save' not in st.session_state:
-        st.session_state.form_auto_save = True
+try:
+    from src.config.env_config import env_config as _ENV_CONFIG
+except ImportError:
+    _ENV_CONFIG = None
+
+# Selectbox options and their precomputed index lookups
+GENRES = ("Kids", "Education", "Gaming", "Comedy", "Music", "Other")
+TONES = ("Funny", "Serious", "Educational", "Cinematic", "Other")
+LANGUAGES = ("English", "Hindi", "Spanish", "French", "Other")
+VOICES = ("Male", "Female", "Robotic", "Celebrity mimic", "No Voice")
+
+GENRE_INDEX = {genre: i for i, genre in enumerate(GENRES)}
+TONE_INDEX = {tone: i for i, tone in enumerate(TONES)}
+LANGUAGE_INDEX = {language: i for i, language in enumerate(LANGUAGES)}
+VOICE_INDEX = {voice: i for i, voice in enumerate(VOICES)}
+
+# Fixed production/publishing settings
+_VIDEO_TYPE = "Shorts/Reels"
+_PLATFORMS = ("YouTube",)
+_PRIVACY = "Private"
+_THUMBNAIL_OPTION = "Upload"
+
+# Draft field -> form widget key, and the options a loaded draft value must belong to
+_DRAFT_FIELDS = {
+    'title': 'f_title',
+    'description': 'f_description',
+    'tags': 'f_tags',
+    'genre': 'f_genre',
+    'tone': 'f_tone',
+    'language': 'f_language',
+    'voice_pref': 'f_voice_pref',
+    'storyboard': 'f_storyboard'
+}
+
+_DRAFT_OPTIONS = {
+    'f_genre': GENRE_INDEX,
+    'f_tone': TONE_INDEX,
+    'f_language': LANGUAGE_INDEX,
+    'f_voice_pref': VOICE_INDEX
+}
+
+# Reference uploads kept per form (extra files beyond these limits are ignored)
+_MAX_IMAGE_REFS = 20
+_MAX_IMAGE_REFS_BYTES = 100 * 1024 * 1024
+
+# Quick schedule presets: button key -> (delay, label)
+_QUICK_SCHEDULE = {
+    "5min": (timedelta(minutes=5), "5 minutes"),
+    "10min": (timedelta(minutes=10), "10 minutes"),
+    "15min": (timedelta(minutes=15), "15 minutes"),
+    "20min": (timedelta(minutes=20), "20 minutes"),
+    "25min": (timedelta(minutes=25), "25 minutes"),
+    "30min": (timedelta(minutes=30), "30 minutes"),
+    "1hour": (timedelta(hours=1), "1 hour"),
+    "2hours": (timedelta(hours=2), "2 hours")
+}
+
+@st.cache_resource(show_spinner=False)
+def _get_db():
+    """Create the database schema once per process"""
+    init_db()
+    return True
+
+# API keys a TextImprover has been built for, so the status panel never builds one just to report on it
+_BUILT_TEXT_IMPROVERS = set()
+
+@st.cache_resource(show_spinner=False)
+def _get_text_improver(api_key: str):
+    """Share one TextImprover per API key across sessions and reruns"""
+    _BUILT_TEXT_IMPROVERS.add(api_key)
+    return TextImprover(gemini_api_key=api_key)
+
+# Identical improvement requests are served from cache instead of another Gemini round-trip:
+# st.cache_data in memory, backed by the on-disk cache shared across sessions and restarts
+_AI_CACHE_TTL = 24 * 60 * 60
+
+def _gemini_result(result_and_source):
+    """Pass a Gemini result on to the caches; anything else is returned uncached so the next click retries Gemini"""
+    result, source = result_and_source
+    if source != 'gemini':
+        raise UncachedResult(result)
+    return result
+
+def _improve(cached_fn, *args):
+    """Call a cached improver, returning fallback results that were kept out of the cache"""
+    try:
+        return cached_fn(*args)
+    except UncachedResult as e:
+        return e.result
+
+@st.cache_data(show_spinner=False, ttl=_AI_CACHE_TTL, max_entries=256)
+def _cached_improve_title(api_key, title, genre, tone):
+    return cached_call(
+        "improve_title", (api_key, title, genre, tone),
+        lambda: _gemini_result(_get_text_improver(api_key).improve_title(title, genre, tone, return_source=True)),
+        ttl=_AI_CACHE_TTL
+    )
+
+@st.cache_data(show_spinner=False, ttl=_AI_CACHE_TTL, max_entries=256)
+def _cached_improve_description(api_key, description, genre, tone):
+    return cached_call(
+        "improve_description", (api_key, description, genre, tone),
+        lambda: _gemini_result(_get_text_improver(api_key).improve_description(description, genre, tone, return_source=True)),
+        ttl=_AI_CACHE_TTL
+    )
+
+@st.cache_data(show_spinner=False, ttl=_AI_CACHE_TTL, max_entries=256)
+def _cached_improve_tags(api_key, tags, title, description, genre, tone):
+    return cached_call(
+        "improve_tags", (api_key, tags, title, description, genre, tone),
+        lambda: _gemini_result(_get_text_improver(api_key).improve_tags(list(tags), title, description, genre, tone, return_source=True)),
+        ttl=_AI_CACHE_TTL
+    )
+
+@st.cache_data(show_spinner=False, ttl=_AI_CACHE_TTL, max_entries=256)
+def _cached_improve_all_content(api_key, title, description, tags, genre, tone):
+    return cached_call(
+        "improve_all_content", (api_key, title, description, tags, genre, tone),
+        lambda: _gemini_result(_get_text_improver(api_key).improve_all_content(title, description, list(tags), genre, tone, return_source=True)),
+        ttl=_AI_CACHE_TTL
+    )
+
+# temp/*.mp4 listing keyed by the directory's mtime, so unchanged folders skip the rescan
+_GLOB_CACHE = {}
+
+def _scan_temp_mp4(temp_dir="temp"):
+    """Return (name, path, size) for each .mp4 in temp_dir, largest first"""
+    try:
+        key = os.stat(temp_dir).st_mtime_ns
+    except OSError:
+        return []
+    
+    hit = _GLOB_CACHE.get(temp_dir)
+    if hit and hit[0] == key:
+        return hit[1]
+    
+    videos = []
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".mp4") and entry.is_file():
+                videos.append((entry.name, os.path.join(temp_dir, entry.name), entry.stat().st_size))
+    videos.sort(key=lambda video: video[2], reverse=True)
+    
+    _GLOB_CACHE[temp_dir] = (key, videos)
+    return videos
+
+def _draft_id():
+    """Stable draft key for this browser tab, carried in the URL so it survives reloads"""
+    draft_id = st.query_params.get("draft")
+    if not draft_id:
+        draft_id = uuid.uuid4().hex
+        st.query_params["draft"] = draft_id
+    return draft_id
+
+def _path_stat(key, refresh=False):
+    """Return the stat_result of the file stored under session_state[key], statting each new path once;
+    refresh re-checks the disk, for when the file may have been deleted since it was cached"""
+    path = st.session_state.get(key)
+    if not path:
+        return None
     
-    if 'form_draft_data' not in st.session_state:
-        st.session_state.form_draft_data = {}
+    entry = st.session_state.get(key + "_stat")
+    if entry and entry[0] == path and not refresh:
+        return entry[1]
     
-    # Initialize database if needed
     try:
-        init_db()
-        st.success("✅ Database connected successfully!")
-    except Exception as e:
-        st.error(f"❌ Database connection failed: {e}")
-        return
+        stat_result = Path(path).stat()
+    except OSError:
+        st.session_state.pop(key + "_stat", None)
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+    st.session_state[key + "_stat"] = (path, stat_result)
+    return stat_result
 
-    # --- 1️⃣ Content Details ---
+def _cache_image_ref_names():
+    """Rebuild the reference name/size list only when the uploaded files change, within the upload limits"""
+    image_refs = st.session_state.get('img_refs') or []
+    kept = []
+    total_bytes = 0
+    for f in image_refs:
+        if len(kept) >= _MAX_IMAGE_REFS or total_bytes + f.size > _MAX_IMAGE_REFS_BYTES:
+            break
+        kept.append({"name": f.name, "size": f.size})
+        total_bytes += f.size
+    st.session_state._image_ref_names = kept
+    st.session_state._image_refs_dropped = len(image_refs) - len(kept)
+
+def _parse_tags(tags):
+    """Split the comma separated tags field into a tuple of non-empty tags"""
+    return tuple(t.strip() for t in tags.split(",") if t.strip()) if tags else ()
+
+def _apply_quick_schedule(preset):
+    """Button callback: move the schedule date/time widgets to a preset offset from now"""
+    quick_delay = _QUICK_SCHEDULE.get(preset)
+    if quick_delay is not None:
+        target = datetime.now() + quick_delay[0]
+        st.session_state.f_schedule_date = target.date()
+        st.session_state.f_schedule_time = target.time().replace(microsecond=0)
+    st.session_state.quick_schedule = preset
+
+def _current_form_data():
+    """Summary shown in the Current Form Data expander"""
+    improved = st.session_state.setdefault('improved_content', {})
+    return {
+        "title": improved.get('title', st.session_state.get('f_title', '')),
+        "description": improved.get('description', st.session_state.get('f_description', '')),
+        "tags": improved.get('tags', list(_parse_tags(st.session_state.get('f_tags', '')))),
+        "genre": st.session_state.get('f_genre'),
+        "video_type": _VIDEO_TYPE,
+        "expected_length": st.session_state.get('f_expected_length'),
+        "platforms": list(_PLATFORMS)
+    }
+
+def _refresh_form_data_view():
+    """Rerun the whole app when a fragment changed a value the Current Form Data expander shows,
+    since a fragment rerun leaves the rest of the page as it was"""
+    if _current_form_data() != st.session_state.get('_form_data_shown'):
+        st.rerun(scope="app")
+
+@st.fragment
+def _content_details_section():
+    """Content fields, drafts and video input (reruns on its own when these widgets change)"""
     st.header("1️⃣ Content Details")
     
     # Form state management
@@ -52,73 +260,52 @@ def video_input_form():
             
             if auto_save != st.session_state.form_auto_save:
                 st.session_state.form_auto_save = auto_save
-                st.rerun()
         
         with col2:
-            # Manual save draft
-            if st.button("💾 Save Draft"):
-                # Save current form data to session state
-                current_form_data = {
-                    'title': title,
-                    'description': description,
-                    'tags': tags,
-                    'genre': genre,
-                    'tone': tone,
-                    'language': language,
-                    'voice_pref': voice_pref,
-                    'storyboard': storyboard
-                }
-                st.session_state.form_draft_data = current_form_data
-                st.session_state.form_last_save = datetime.now()
-                st.success("✅ Draft saved!")
+            # Manual save draft (widget values from the previous run are already in session state)
+            if st.button("💾 Save Draft", key="save_draft"):
+                try:
+                    save_draft(_draft_id(), {field: st.session_state.get(key) for field, key in _DRAFT_FIELDS.items()})
+                    st.session_state.form_last_save = datetime.now()
+                    st.success("✅ Draft saved!")
+                except Exception as e:
+                    st.error(f"❌ Failed to save draft: {e}")
         
         with col3:
-            # Load draft
-            if st.button("📂 Load Draft") and st.session_state.form_draft_data:
-                st.session_state.load_draft = True
-                st.rerun()
+            # Load draft straight into the widget state (the widgets below are not created yet in this run)
+            if st.button("📂 Load Draft", key="load_draft"):
+                draft_data = load_draft(_draft_id())
+                if draft_data:
+                    for field, key in _DRAFT_FIELDS.items():
+                        value = draft_data.get(field)
+                        if value is not None and (key not in _DRAFT_OPTIONS or value in _DRAFT_OPTIONS[key]):
+                            st.session_state[key] = value
+                    st.success("✅ Draft loaded successfully!")
+                else:
+                    st.warning("⚠️ No saved draft found")
             
             if st.session_state.form_last_save:
                 st.info(f"Last save: {st.session_state.form_last_save.strftime('%H:%M:%S')}")
     
-    # Load draft data if requested
-    if st.session_state.get('load_draft', False) and st.session_state.form_draft_data:
-        draft_data = st.session_state.form_draft_data
-        title = draft_data.get('title', title)
-        description = draft_data.get('description', description)
-        tags = draft_data.get('tags', tags)
-        genre = draft_data.get('genre', genre)
-        tone = draft_data.get('tone', tone)
-        language = draft_data.get('language', language)
-        voice_pref = draft_data.get('voice_pref', voice_pref)
-        storyboard = draft_data.get('storyboard', storyboard)
-        
-        # Clear the load flag
-        del st.session_state.load_draft
-        st.success("✅ Draft loaded successfully!")
-    
-    title = st.text_input("Video Title", placeholder="Enter your video title", value=title if 'title' in locals() else "")
-    description = st.text_area("Description / Body", placeholder="Detailed description or script", value=description if 'description' in locals() else "")
-    tags = st.text_input("Tags / Keywords (comma separated)", value=tags if 'tags' in locals() else "")
-    genre = st.selectbox("Genre / Category", ["Kids", "Education", "Gaming", "Comedy", "Music", "Other"], index=["Kids", "Education", "Gaming", "Comedy", "Music", "Other"].index(genre) if 'genre' in locals() and genre in ["Kids", "Education", "Gaming", "Comedy", "Music", "Other"] else 0)
+    st.text_input("Video Title", placeholder="Enter your video title", key="f_title")
+    st.text_area("Description / Body", placeholder="Detailed description or script", key="f_description")
+    st.text_input("Tags / Keywords (comma separated)", key="f_tags")
+    st.selectbox("Genre / Category", GENRES, key="f_genre")
     
     # Video Input Section
     st.markdown("### 🎬 Video Input")
     
     # Check for existing video files in temp folder
-    import glob
-    existing_videos = glob.glob("temp/*.mp4")
+    existing_videos = _scan_temp_mp4()
     existing_video_path = None
     
     if existing_videos:
         # Find the largest video file (most likely the real video)
-        existing_videos.sort(key=lambda x: os.path.getsize(x), reverse=True)
-        largest_video = existing_videos[0]
-        file_size = os.path.getsize(largest_video)
+        largest_name, largest_video, file_size = existing_videos[0]
         
         if file_size > 1000:  # More than 1KB indicates real video
             existing_video_path = largest_video
-            st.success(f"✅ Found existing video: {os.path.basename(largest_video)} ({file_size/1024/1024:.2f} MB)")
+            st.success(f"✅ Found existing video: {largest_name} ({file_size/1024/1024:.2f} MB)")
             st.info(f"📁 Path: {largest_video}")
             
             # Store in session state
@@ -131,31 +318,32 @@ def video_input_form():
     uploaded_video = st.file_uploader(
         "Upload Video File (MP4, MOV, AVI) - Optional if existing video found", 
         type=['mp4', 'mov', 'avi', 'mkv'],
-        help="Upload your video file. If no file is uploaded, the system will use the existing video found above."
+        help="Upload your video file. If no file is uploaded, the system will use the existing video found above.",
+        key="f_video_file"
     )
     
     if uploaded_video is not None:
         # Save uploaded video to temp directory
-        import tempfile
-        import os
-        
         # Create temp directory if it doesn't exist
         temp_dir = Path("temp")
         temp_dir.mkdir(exist_ok=True)
         
         # Save uploaded file
         video_path = f"temp/uploaded_video_{int(time.time())}.mp4"
+        uploaded_video.seek(0)
         with open(video_path, "wb") as f:
-            f.write(uploaded_video.getbuffer())
+            # Copy in 1 MiB blocks rather than materializing the whole upload as one bytes object
+            shutil.copyfileobj(uploaded_video, f, length=1024 * 1024)
         
         st.success(f"✅ Video uploaded successfully: {uploaded_video.name}")
         st.info(f"📁 Saved to: {video_path}")
         
-        # Store video path in session state
+        # Store video path in session state, with its stat so later checks skip the syscall
         st.session_state.uploaded_video_path = video_path
+        st.session_state.uploaded_video_path_stat = (video_path, Path(video_path).stat())
     else:
         # Check if we have a previously uploaded video
-        if 'uploaded_video_path' in st.session_state and os.path.exists(st.session_state.uploaded_video_path):
+        if _path_stat('uploaded_video_path') is not None:
             st.info(f"📁 Using previously uploaded video: {st.session_state.uploaded_video_path}")
         elif existing_video_path:
             st.info(f"📁 Will use existing video: {existing_video_path}")
@@ -167,17 +355,34 @@ def video_input_form():
         video_link = st.text_input(
             "External Video Link", 
             value=st.session_state.get('video_link', ''),
-            help="Provide a direct link to an external video file (optional)"
+            help="Provide a direct link to an external video file (optional)",
+            key="f_video_link"
         )
         if video_link:
             st.session_state.video_link = video_link
     
-    storyboard = st.text_area("Storyboard / Script (Optional)", value=storyboard if 'storyboard' in locals() else "")
-    tone = st.selectbox("Tone / Style", ["Funny", "Serious", "Educational", "Cinematic", "Other"], index=["Funny", "Serious", "Educational", "Cinematic", "Other"].index(tone) if 'tone' in locals() and tone in ["Funny", "Serious", "Educational", "Cinematic", "Other"] else 0)
-    language = st.selectbox("Language", ["English", "Hindi", "Spanish", "French", "Other"], index=["English", "Hindi", "Spanish", "French", "Other"].index(language) if 'language' in locals() and language in ["English", "Hindi", "Spanish", "French", "Other"] else 0)
-    voice_pref = st.selectbox("Voice Preference", ["Male", "Female", "Robotic", "Celebrity mimic", "No Voice"], index=["Male", "Female", "Robotic", "Celebrity mimic", "No Voice"].index(voice_pref) if 'voice_pref' in locals() and voice_pref in ["Male", "Female", "Robotic", "Celebrity mimic", "No Voice"] else 0)
-    image_refs = st.file_uploader("Image/Video References", type=["jpg", "png", "mp4"], accept_multiple_files=True)
+    st.text_area("Storyboard / Script (Optional)", key="f_storyboard")
+    st.selectbox("Tone / Style", TONES, key="f_tone")
+    st.selectbox("Language", LANGUAGES, key="f_language")
+    st.selectbox("Voice Preference", VOICES, key="f_voice_pref")
+    st.file_uploader("Image/Video References", type=["jpg", "png", "mp4"], accept_multiple_files=True, key="img_refs", on_change=_cache_image_ref_names)
+    if st.session_state.get('_image_refs_dropped'):
+        st.error(f"❌ Too many/large references: only the first {len(st.session_state._image_ref_names)} files "
+                 f"(max {_MAX_IMAGE_REFS}, {_MAX_IMAGE_REFS_BYTES // (1024 * 1024)} MB total) will be saved. Remove the extra files to free memory.")
+    
+    _refresh_form_data_view()
 
+@st.fragment
+def _ai_improvement_section():
+    """Gemini configuration and the Improve buttons"""
+    title = st.session_state.get('f_title', '')
+    description = st.session_state.get('f_description', '')
+    tags = st.session_state.get('f_tags', '')
+    genre = st.session_state.get('f_genre')
+    tone = st.session_state.get('f_tone')
+    # Parsed once per run and shared by the tag helpers
+    parsed_tags = _parse_tags(tags)
+    
     # AI Text Improvement Section
     st.subheader("🤖 AI Text Enhancement")
     
@@ -185,18 +390,20 @@ def video_input_form():
     with st.expander("🔑 Gemini API Configuration", expanded=False):
         st.info("💡 Configure Google Gemini API for enhanced AI text improvement")
         
-        # Try to load API key from environment configuration first
-        try:
-            from src.config.env_config import env_config
-            env_gemini_key = env_config.get_gemini_api_key()
+        # Try to load API key from environment configuration first (read once per session)
+        if _ENV_CONFIG is not None:
+            if '_env_gemini_key' not in st.session_state:
+                st.session_state._env_gemini_key = _ENV_CONFIG.get_gemini_api_key()
+            env_gemini_key = st.session_state._env_gemini_key
             
             if env_gemini_key:
                 st.success("✅ Gemini API key loaded from environment configuration")
                 st.info("🔒 API key is securely stored in config.env file")
                 
-                # Show API key status
-                if hasattr(st.session_state, 'text_improver'):
-                    status = st.session_state.text_improver.get_status()
+                # Show API key status once an improver exists for the key in use
+                active_key = st.session_state.get('gemini_api_key', env_gemini_key)
+                if active_key in _BUILT_TEXT_IMPROVERS:
+                    status = _get_text_improver(active_key).get_status()
                     if status.get('gemini_configured'):
                         st.success("🤖 Gemini API is active and ready to use")
                     else:
@@ -207,7 +414,7 @@ def video_input_form():
                 # Allow manual override if needed
                 st.info("💡 You can manually override the environment key below if needed")
                 
-        except ImportError:
+        else:
             st.warning("⚠️ Environment configuration not available")
             env_gemini_key = None
         
@@ -220,14 +427,13 @@ def video_input_form():
             value=st.session_state.gemini_api_key,
             type="password",
             placeholder="Enter your Gemini API key here to override environment",
-            help="Get your API key from https://makersuite.google.com/app/apikey. Leave empty to use environment configuration."
+            help="Get your API key from https://makersuite.google.com/app/apikey. Leave empty to use environment configuration.",
+            key="f_gemini_api_key"
         )
         
         if gemini_api_key != st.session_state.gemini_api_key:
+            # The cached text improver is keyed on the API key, so no instance patching is needed
             st.session_state.gemini_api_key = gemini_api_key
-            # Update the text improver with new API key
-            if hasattr(st.session_state, 'text_improver'):
-                st.session_state.text_improver.set_gemini_api_key(gemini_api_key)
         
         # Show current API key source
         if env_gemini_key and not gemini_api_key:
@@ -237,286 +443,256 @@ def video_input_form():
         else:
             st.warning("⚠️ No Gemini API key available - using fallback methods")
     
-    # Initialize text improver with API key
-    if 'text_improver' not in st.session_state:
-        from src.utils.text_improver import TextImprover
-        # Use environment key if available, otherwise use session state
-        api_key = env_gemini_key if 'env_gemini_key' in locals() else st.session_state.get('gemini_api_key', '')
-        st.session_state.text_improver = TextImprover(gemini_api_key=api_key)
-    elif st.session_state.get('gemini_api_key') != st.session_state.text_improver.gemini_api_key:
-        # Update API key if changed
-        st.session_state.text_improver.set_gemini_api_key(st.session_state.get('gemini_api_key', ''))
+    # The text improver itself is only built inside the cached wrappers, on the first Improve click
+    api_key = st.session_state.get('gemini_api_key', '')
     
-    # Get text improver instance
-    text_improver = st.session_state.text_improver
+    # AI results for the current form, held in one dict so a save clears them in a single call
+    improved = st.session_state.setdefault('improved_content', {})
     
     # Show improvement options
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("✨ Improve Title", type="secondary"):
+        if st.button("✨ Improve Title", type="secondary", key="improve_title"):
             if title:
                 with st.spinner("🤖 Improving title with AI..."):
-                    improved_title = text_improver.improve_title(title, genre, tone)
-                    st.session_state.improved_title = improved_title
+                    improved_title = _improve(_cached_improve_title, api_key, title, genre, tone)
+                    improved['title'] = improved_title
                     st.success(f"✅ Title improved: {improved_title}")
             else:
                 st.warning("⚠️ Please enter a title first")
         
-        if st.button("✨ Improve Description", type="secondary"):
+        if st.button("✨ Improve Description", type="secondary", key="improve_description"):
             if description:
                 with st.spinner("🤖 Improving description with AI..."):
-                    improved_desc = text_improver.improve_description(description, genre, tone)
-                    st.session_state.improved_description = improved_desc
+                    improved_desc = _improve(_cached_improve_description, api_key, description, genre, tone)
+                    improved['description'] = improved_desc
                     st.success(f"✅ Description improved: {improved_desc[:100]}...")
             else:
                 st.warning("⚠️ Please enter a description first")
     
     with col2:
-        if st.button("✨ Improve Tags", type="secondary"):
+        if st.button("✨ Improve Tags", type="secondary", key="improve_tags"):
             if tags:
                 with st.spinner("🤖 Improving tags with AI..."):
-                    tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-                    improved_tags = text_improver.improve_tags(tag_list, title, description, genre, tone)
-                    st.session_state.improved_tags = improved_tags
+                    improved_tags = _improve(_cached_improve_tags, api_key, parsed_tags, title, description, genre, tone)
+                    improved['tags'] = improved_tags
                     st.success(f"✅ Tags improved: {len(improved_tags)} tags generated")
             else:
                 st.warning("⚠️ Please enter tags first")
         
-        if st.button("✨ Improve All Content", type="secondary"):
+        if st.button("✨ Improve All Content", type="secondary", key="improve_all"):
             if title and description and tags:
                 with st.spinner("🤖 Improving all content with AI..."):
-                    improved_content = text_improver.improve_all_content(title, description, [t.strip() for t in tags.split(",") if t.strip()], genre, tone)
-                    st.session_state.improved_title = improved_content['title']
-                    st.session_state.improved_description = improved_content['description']
-                    st.session_state.improved_tags = improved_content['tags']
+                    improved_content = _improve(_cached_improve_all_content, api_key, title, description, parsed_tags, genre, tone)
+                    improved.update(title=improved_content['title'], description=improved_content['description'], tags=improved_content['tags'])
                     st.success("✅ All content improved successfully!")
             else:
                 st.warning("⚠️ Please fill in title, description, and tags first")
     
     # Display improved content if available
-    if 'improved_title' in st.session_state or 'improved_description' in st.session_state or 'improved_tags' in st.session_state:
+    if improved:
         with st.expander("✨ AI Improved Content", expanded=True):
-            if 'improved_title' in st.session_state:
-                st.write(f"**Improved Title:** {st.session_state.improved_title}")
-            if 'improved_description' in st.session_state:
-                st.write(f"**Improved Description:** {st.session_state.improved_description}")
-            if 'improved_tags' in st.session_state:
-                st.write(f"**Improved Tags:** {', '.join(st.session_state.improved_tags)}")
+            if 'title' in improved:
+                st.write(f"**Improved Title:** {improved['title']}")
+            if 'description' in improved:
+                st.write(f"**Improved Description:** {improved['description']}")
+            if 'tags' in improved:
+                st.write(f"**Improved Tags:** {', '.join(improved['tags'])}")
             
             # Show which AI method was used
-            if hasattr(text_improver, 'gemini_api_key') and text_improver.gemini_api_key:
+            if api_key or env_gemini_key:
                 st.success("🤖 Content improved using Google Gemini API")
             else:
                 st.info("📝 Content improved using fallback methods")
+    
+    _refresh_form_data_view()
 
-    # --- 2️⃣ Production Settings ---
+@st.fragment
+def _production_settings_section():
+    """Video production options"""
     st.header("2️⃣ Production Settings")
     # Hardcoded to Shorts/Reels only as requested
-    video_type = "Shorts/Reels"
-    st.info(f"🎬 Video Type: {video_type} (Hardcoded for production)")
-    
-    expected_length = st.number_input("Expected Length (seconds)", min_value=5, max_value=600, value=60)
-    resolution = st.selectbox("Resolution", ["720p", "1080p", "4K"])
-    aspect_ratio = st.selectbox("Aspect Ratio", ["9:16"])  # Only 9:16 for shorts/reels
-    bg_music_toggle = st.checkbox("Add Background Music?")
-    bg_music_source = None
-    if bg_music_toggle:
-        bg_music_source = st.radio("Background Music Source", ["AI-generate", "Upload"])
-        if bg_music_source == "Upload":
-            st.file_uploader("Upload Music File", type=["mp3", "wav"])
-    captions_toggle = st.checkbox("Add Subtitles / Captions?")
-    watermark_toggle = st.checkbox("Add Watermark / Branding?")
-    if watermark_toggle:
-        st.file_uploader("Upload Watermark", type=["png"])
-    intro_toggle = st.checkbox("Add Intro?")
-    outro_toggle = st.checkbox("Add Outro?")
-    effects_style = st.selectbox("Transitions / Effects Style", ["Smooth", "Fast cuts", "Flashy", "Minimal"])
-
-    # --- 3️⃣ Publishing Settings ---
+    st.info(f"🎬 Video Type: {_VIDEO_TYPE} (Hardcoded for production)")
+    
+    st.number_input("Expected Length (seconds)", min_value=5, max_value=600, value=60, key="f_expected_length")
+    st.selectbox("Resolution", ["720p", "1080p", "4K"], key="f_resolution")
+    st.selectbox("Aspect Ratio", ["9:16"], key="f_aspect_ratio")  # Only 9:16 for shorts/reels
+    if st.checkbox("Add Background Music?", key="f_bg_music"):
+        if st.radio("Background Music Source", ["AI-generate", "Upload"], key="f_bg_music_source") == "Upload":
+            st.file_uploader("Upload Music File", type=["mp3", "wav"], key="f_music_file")
+    st.checkbox("Add Subtitles / Captions?", key="f_captions")
+    if st.checkbox("Add Watermark / Branding?", key="f_watermark"):
+        st.file_uploader("Upload Watermark", type=["png"], key="f_watermark_file")
+    st.checkbox("Add Intro?", key="f_intro")
+    st.checkbox("Add Outro?", key="f_outro")
+    st.selectbox("Transitions / Effects Style", ["Smooth", "Fast cuts", "Flashy", "Minimal"], key="f_effects_style")
+    
+    _refresh_form_data_view()
+
+@st.fragment
+def _publishing_settings_section():
+    """Schedule, privacy and publishing options"""
+    # One clock read per run keeps all scheduling math on the same instant
+    now = datetime.now()
+    
     st.header("3️⃣ Publishing Settings")
     # Hardcoded to YouTube only as requested
-    platforms = ["YouTube"]
-    st.info(f"📺 Publishing Platform: {', '.join(platforms)} (Hardcoded for production)")
+    st.info(f"📺 Publishing Platform: {', '.join(_PLATFORMS)} (Hardcoded for production)")
     
     # Removed channel name as requested - using credentials directly
-    schedule = st.date_input("Schedule Date", min_value=datetime.today())
+    st.date_input("Schedule Date", min_value=now.date(), key="f_schedule_date")
     
     # Enhanced schedule time with 5-minute intervals
     st.subheader("⏰ Schedule Time Options")
     
-    # Quick time presets with 5-minute intervals
-    col1, col2, col3 = st.columns(3)
+    # Quick time presets with 5-minute intervals, laid out as one 3-column grid
+    st.write("**Quick Schedule (5-min intervals):**")
+    qcol1, qcol2, qcol3 = st.columns(3)
     
-    with col1:
-        st.write("**Quick Schedule (5-min intervals):**")
-        if st.button("🕐 Now + 5 min", key="schedule_5min"):
-            st.session_state.quick_schedule = "5min"
-            st.rerun()
-        if st.button("🕐 Now + 10 min", key="schedule_10min"):
-            st.session_state.quick_schedule = "10min"
-            st.rerun()
-        if st.button("🕐 Now + 15 min", key="schedule_15min"):
-            st.session_state.quick_schedule = "15min"
-            st.rerun()
+    with qcol1:
+        st.button("🕐 Now + 5 min", key="schedule_5min", on_click=_apply_quick_schedule, args=("5min",))
+        st.button("🕐 Now + 20 min", key="schedule_20min", on_click=_apply_quick_schedule, args=("20min",))
+        st.button("🕐 Now + 1 hour", key="schedule_1hour", on_click=_apply_quick_schedule, args=("1hour",))
     
-    with col2:
-        st.write("**Quick Schedule (5-min intervals):**")
-        if st.button("🕐 Now + 20 min", key="schedule_20min"):
-            st.session_state.quick_schedule = "20min"
-            st.rerun()
-        if st.button("🕐 Now + 25 min", key="schedule_25min"):
-            st.session_state.quick_schedule = "25min"
-            st.rerun()
-        if st.button("🕐 Now + 30 min", key="schedule_30min"):
-            st.session_state.quick_schedule = "30min"
-            st.rerun()
+    with qcol2:
+        st.button("🕐 Now + 10 min", key="schedule_10min", on_click=_apply_quick_schedule, args=("10min",))
+        st.button("🕐 Now + 25 min", key="schedule_25min", on_click=_apply_quick_schedule, args=("25min",))
+        st.button("🕐 Now + 2 hours", key="schedule_2hours", on_click=_apply_quick_schedule, args=("2hours",))
     
-    with col3:
-        st.write("**Custom Schedule:**")
-        if st.button("🕐 Now + 1 hour", key="schedule_1hour"):
-            st.session_state.quick_schedule = "1hour"
-            st.rerun()
-        if st.button("🕐 Now + 2 hours", key="schedule_2hours"):
-            st.session_state.quick_schedule = "2hours"
-            st.rerun()
-        if st.button("🕐 Custom Time", key="schedule_custom"):
-            st.session_state.quick_schedule = "custom"
-            st.rerun()
+    with qcol3:
+        st.button("🕐 Now + 15 min", key="schedule_15min", on_click=_apply_quick_schedule, args=("15min",))
+        st.button("🕐 Now + 30 min", key="schedule_30min", on_click=_apply_quick_schedule, args=("30min",))
+        st.button("🕐 Custom Time", key="schedule_custom", on_click=_apply_quick_schedule, args=("custom",))
     
-    # Handle quick schedule selection
-    if 'quick_schedule' in st.session_state:
-        quick_schedule = st.session_state.quick_schedule
-        
-        if quick_schedule == "5min":
-            schedule_time = (datetime.now() + timedelta(minutes=5)).time()
-            st.success("✅ Scheduled for 5 minutes from now")
-        elif quick_schedule == "10min":
-            schedule_time = (datetime.now() + timedelta(minutes=10)).time()
-            st.success("✅ Scheduled for 10 minutes from now")
-        elif quick_schedule == "15min":
-            schedule_time = (datetime.now() + timedelta(minutes=15)).time()
-            st.success("✅ Scheduled for 15 minutes from now")
-        elif quick_schedule == "20min":
-            schedule_time = (datetime.now() + timedelta(minutes=20)).time()
-            st.success("✅ Scheduled for 20 minutes from now")
-        elif quick_schedule == "25min":
-            schedule_time = (datetime.now() + timedelta(minutes=25)).time()
-            st.success("✅ Scheduled for 25 minutes from now")
-        elif quick_schedule == "30min":
-            schedule_time = (datetime.now() + timedelta(minutes=30)).time()
-            st.success("✅ Scheduled for 30 minutes from now")
-        elif quick_schedule == "1hour":
-            schedule_time = (datetime.now() + timedelta(hours=1)).time()
-            st.success("✅ Scheduled for 1 hour from now")
-        elif quick_schedule == "2hours":
-            schedule_time = (datetime.now() + timedelta(hours=2)).time()
-            st.success("✅ Scheduled for 2 hours from now")
-        elif quick_schedule == "custom":
-            schedule_time = st.time_input("Custom Schedule Time")
-            st.info("⏰ Set your custom schedule time")
-        
-        # Clear quick schedule after use
-        del st.session_state.quick_schedule
-    else:
-        # Default time input
-        schedule_time = st.time_input("Schedule Time")
+    # Confirm the quick schedule selection (the callback already moved the date/time widgets)
+    quick_schedule = st.session_state.pop('quick_schedule', None)
+    if quick_schedule in _QUICK_SCHEDULE:
+        st.success(f"✅ Scheduled for {_QUICK_SCHEDULE[quick_schedule][1]} from now")
+    elif quick_schedule == "custom":
+        st.info("⏰ Set your custom schedule time")
+    
+    schedule_time = st.time_input("Schedule Time", key="f_schedule_time")
     
     # Show selected schedule
-    if 'schedule_time' in locals():
-        selected_datetime = datetime.combine(schedule, schedule_time)
-        time_until = selected_datetime - datetime.now()
-        
-        if time_until.total_seconds() > 0:
-            if time_until.total_seconds() < 3600:  # Less than 1 hour
-                minutes = int(time_until.total_seconds() // 60)
-                st.info(f"⏰ Video will be processed in {minutes} minutes")
-            else:
-                hours = int(time_until.total_seconds() // 3600)
-                minutes = int((time_until.total_seconds() % 3600) // 60)
-                st.info(f"⏰ Video will be processed in {hours} hours and {minutes} minutes")
+    selected_datetime = datetime.combine(st.session_state.f_schedule_date, schedule_time)
+    time_until = selected_datetime - now
+    
+    if time_until.total_seconds() > 0:
+        if time_until.total_seconds() < 3600:  # Less than 1 hour
+            minutes = int(time_until.total_seconds() // 60)
+            st.info(f"⏰ Video will be processed in {minutes} minutes")
         else:
-            st.warning("⚠️ Selected time is in the past. Video will be processed immediately.")
-            schedule_time = datetime.now().time()
-            schedule = datetime.now().date()
+            hours = int(time_until.total_seconds() // 3600)
+            minutes = int((time_until.total_seconds() % 3600) // 60)
+            st.info(f"⏰ Video will be processed in {hours} hours and {minutes} minutes")
+    else:
+        st.warning("⚠️ Selected time is in the past. Video will be processed immediately.")
     
     # Hardcoded to Private as requested - can't upload public videos directly
-    privacy = "Private"
-    st.info(f"🔒 Privacy Setting: {privacy} (Hardcoded for production - public uploads not supported)")
+    st.info(f"🔒 Privacy Setting: {_PRIVACY} (Hardcoded for production - public uploads not supported)")
     
     # Removed monetization, audience, cross posting, and notify subscribers as requested
-    thumbnail_option = "Upload"  # Hardcoded to upload only as requested
     st.info("🖼️ Thumbnail: Upload only (AI generation disabled)")
-    if thumbnail_option == "Upload":
-        st.file_uploader("Upload Thumbnail", type=["jpg", "png"])
-    pinned_comment = st.text_area("Pinned Comment (YouTube only)")
+    if _THUMBNAIL_OPTION == "Upload":
+        st.file_uploader("Upload Thumbnail", type=["jpg", "png"], key="f_thumbnail_file")
+    st.text_area("Pinned Comment (YouTube only)", key="f_pinned_comment")
 
+def _action_buttons_section():
+    """Save / queue / delete actions; reads every field from session state"""
+    improved = st.session_state.setdefault('improved_content', {})
+    
     # Action Buttons
     col1, col2, col3 = st.columns(3)
     
+    st.session_state.setdefault('_save_queue', [])
+    
     with col1:
-        if st.button("💾 Save to Database", type="primary"):
+        save_clicked = st.button("💾 Save to Database", type="primary", key="save_to_db")
+        queue_clicked = st.button("📥 Add to Save Queue", type="secondary", key="add_to_queue")
+        
+        if save_clicked or queue_clicked:
+            # Snapshot the session values this handler reads (writes still go through st.session_state)
+            state = {key: st.session_state.get(key) for key in (
+                'uploaded_video_path', 'existing_video_path', 'video_link', '_image_ref_names',
+                'f_title', 'f_description', 'f_tags', 'f_genre', 'f_tone', 'f_language', 'f_voice_pref',
+                'f_storyboard', 'f_expected_length', 'f_resolution', 'f_aspect_ratio', 'f_bg_music',
+                'f_bg_music_source', 'f_captions', 'f_watermark', 'f_intro', 'f_outro', 'f_effects_style',
+                'f_schedule_date', 'f_schedule_time', 'f_pinned_comment'
+            )}
+            
             # Determine which video path to use
             video_path_to_use = None
             
-            if st.session_state.get('uploaded_video_path') and os.path.exists(st.session_state.uploaded_video_path):
+            # Re-check the disk: failed jobs and temp cleanup can delete a file after it was cached
+            uploaded_stat = _path_stat('uploaded_video_path', refresh=True)
+            existing_stat = _path_stat('existing_video_path', refresh=True) if uploaded_stat is None else None
+            
+            if uploaded_stat is not None:
                 # Use newly uploaded video
-                video_path_to_use = st.session_state.uploaded_video_path
-                st.info(f"📁 Using newly uploaded video: {video_path_to_use}")
-            elif st.session_state.get('existing_video_path') and os.path.exists(st.session_state.existing_video_path):
+                video_path_to_use = state['uploaded_video_path']
+                st.info(f"📁 Using newly uploaded video: {video_path_to_use} ({uploaded_stat.st_size/1024/1024:.2f} MB)")
+            elif existing_stat is not None:
                 # Use existing video found in temp folder
-                video_path_to_use = st.session_state.existing_video_path
-                st.info(f"📁 Using existing video: {video_path_to_use}")
-            elif st.session_state.get('video_link'):
+                video_path_to_use = state['existing_video_path']
+                st.info(f"📁 Using existing video: {video_path_to_use} ({existing_stat.st_size/1024/1024:.2f} MB)")
+            elif state['video_link']:
                 # Use external video link
-                video_path_to_use = st.session_state.video_link
+                video_path_to_use = state['video_link']
                 st.info(f"🔗 Using external video link: {video_path_to_use}")
             else:
                 st.error("❌ No video file available. Please upload a video or ensure there's a video in the temp folder.")
                 return
             
             # Validate required fields
-            if not title or not description or not genre:
+            if not state['f_title'] or not state['f_description'] or not state['f_genre']:
                 st.error("❌ Please fill in all required fields!")
                 return
             
             try:
                 # Prepare data for database saving
                 db_data = {
-                    "title": title,
-                    "description": description,
-                    "genre": genre,
-                    "expected_length": expected_length,
-                    "schedule_time": f"{schedule} {schedule_time}",
-                    "platforms": platforms,
-                    "video_type": video_type,
-                    "music_pref": "Yes" if bg_music_toggle else "No",
+                    "title": state['f_title'],
+                    "description": state['f_description'],
+                    "genre": state['f_genre'],
+                    "expected_length": state['f_expected_length'],
+                    # Past times are processed immediately; stored as naive local time, which the claim
+                    # query compares against datetime('now', 'localtime') in the same space-separated format
+                    "schedule_time": max(datetime.combine(state['f_schedule_date'], state['f_schedule_time']), datetime.now()).isoformat(sep=' ', timespec='seconds'),
+                    "platforms": list(_PLATFORMS),
+                    "video_type": _VIDEO_TYPE,
+                    "music_pref": "Yes" if state['f_bg_music'] else "No",
                     "channel_name": "YouTube Account",  # Placeholder since we're using credentials
                     "video_link": video_path_to_use,  # Use the determined video path
                     "extra_metadata": {
-                        "tone": tone,
-                        "language": language,
-                        "voice_preference": voice_pref,
-                        "storyboard": storyboard,
-                        "resolution": resolution,
-                        "aspect_ratio": aspect_ratio,
-                        "watermark_enabled": watermark_toggle,
-                        "intro_enabled": intro_toggle,
-                        "outro_enabled": outro_toggle,
-                        "effects_style": effects_style,
-                        "privacy": privacy,
-                        "thumbnail_option": thumbnail_option,
-                        "pinned_comment": pinned_comment,
-                        "background_music_source": bg_music_source,
-                        "image_references": [f.name for f in image_refs] if image_refs else [],
-                        "tags": [t.strip() for t in tags.split(",") if t.strip()],
-                        "captions": "Yes" if captions_toggle else "No"
+                        "tone": state['f_tone'],
+                        "language": state['f_language'],
+                        "voice_preference": state['f_voice_pref'],
+                        "storyboard": state['f_storyboard'],
+                        "resolution": state['f_resolution'],
+                        "aspect_ratio": state['f_aspect_ratio'],
+                        "watermark_enabled": state['f_watermark'],
+                        "intro_enabled": state['f_intro'],
+                        "outro_enabled": state['f_outro'],
+                        "effects_style": state['f_effects_style'],
+                        "privacy": _PRIVACY,
+                        "thumbnail_option": _THUMBNAIL_OPTION,
+                        "pinned_comment": state['f_pinned_comment'],
+                        "background_music_source": state['f_bg_music_source'] if state['f_bg_music'] else None,
+                        "image_references": state['_image_ref_names'] or [],
+                        "tags": list(_parse_tags(state['f_tags'])),
+                        "captions": "Yes" if state['f_captions'] else "No"
                     }
                 }
                 
-                # Save to database
-                save_video(db_data)
-                st.success("✅ Video data saved to database successfully!")
+                if queue_clicked:
+                    # Defer the write; queued rows go out in one transaction on flush
+                    st.session_state._save_queue.append(db_data)
+                    st.success(f"📥 Video queued for batch save ({len(st.session_state._save_queue)} in queue)")
+                else:
+                    # Save to database
+                    save_video(db_data)
+                    st.success("✅ Video data saved to database successfully!")
                 
                 # Show saved data summary
                 st.subheader("📊 Saved Data Summary")
@@ -526,23 +702,27 @@ def video_input_form():
                 st.write(f"**Platform:** {', '.join(db_data['platforms'])}")
                 st.write(f"**Video Type:** {db_data['video_type']}")
                 
-                # Clear session state after successful save
-                if 'improved_title' in st.session_state:
-                    del st.session_state.improved_title
-                if 'improved_description' in st.session_state:
-                    del st.session_state.improved_description
-                if 'improved_tags' in st.session_state:
-                    del st.session_state.improved_tags
+                # Clear improved content after successful save
+                improved.clear()
                 
             except Exception as e:
                 st.error(f"❌ Failed to save to database: {e}")
     
+        if st.session_state._save_queue:
+            if st.button(f"🚀 Flush Queue to DB ({len(st.session_state._save_queue)})", key="flush_save_queue"):
+                try:
+                    saved_count = save_videos_bulk(st.session_state._save_queue)
+                    st.session_state._save_queue = []
+                    st.success(f"✅ {saved_count} queued videos saved to database!")
+                except Exception as e:
+                    st.error(f"❌ Failed to flush save queue: {e}")
+    
     with col2:
-        if st.button("🔄 Clear Form", type="secondary"):
+        if st.button("🔄 Clear Form", type="secondary", key="clear_form"):
             st.rerun()
     
     with col3:
-        if st.button("🗑️ Delete All Records", type="secondary"):
+        if st.button("🗑️ Delete All Records", type="secondary", key="delete_all"):
             if st.button("⚠️ Confirm Delete All", key="confirm_delete_all"):
                 try:
                     deleted_count = delete_all_videos()
@@ -553,12 +733,7 @@ def video_input_form():
                     st.session_state.deleted_count = deleted_count
                     
                     # Clear any existing form data
-                    if 'improved_title' in st.session_state:
-                        del st.session_state.improved_title
-                    if 'improved_description' in st.session_state:
-                        del st.session_state.improved_description
-                    if 'improved_tags' in st.session_state:
-                        del st.session_state.improved_tags
+                    improved.clear()
                     
                     # Rerun to update all UI components
                     st.rerun()
@@ -575,18 +750,40 @@ def video_input_form():
         del st.session_state.records_deleted
         del st.session_state.deleted_count
 
+def video_input_form():
+    st.title("🎬 AI Video Creation Form")
+    
+    # Initialize session state for form persistence
+    if 'form_last_save' not in st.session_state:
+        st.session_state.form_last_save = None
+    
+    if 'form_auto_save' not in st.session_state:
+        st.session_state.form_auto_save = True
+    
+    # Initialize database (runs once per process; failures are retried on the next rerun)
+    try:
+        _get_db()
+    except Exception as e:
+        st.error(f"❌ Database connection failed: {e}")
+        return
+    
+    if not st.session_state.get('_db_inited'):
+        st.session_state._db_inited = True
+        st.success("✅ Database connected successfully!")
+    
+    # Each section is a fragment, so interacting with one only reruns that section;
+    # values shared across sections travel through the widgets' session state keys
+    # Snapshot what the Current Form Data expander shows; fragments that change it rerun the app
+    st.session_state._form_data_shown = _current_form_data()
+    _content_details_section()
+    _ai_improvement_section()
+    _production_settings_section()
+    _publishing_settings_section()
+    _action_buttons_section()
+    
     # Display current form data
     with st.expander("📋 Current Form Data"):
-        form_data = {
-            "title": st.session_state.get('improved_title', title),
-            "description": st.session_state.get('improved_description', description),
-            "tags": st.session_state.get('improved_tags', [t.strip() for t in tags.split(",") if t.strip()] if tags else []),
-            "genre": genre,
-            "video_type": video_type,
-            "expected_length": expected_length,
-            "platforms": platforms
-        }
-        st.json(form_data)
+        st.json(_current_form_data())
 
 if __name__ == "__main__":
     video_input_form()
@@ -2,48 +2,454 @@
 Email notification system using SMTP for the Automated Video Generator.
 """
 
-import smtplib
+import asyncio
+import base64
+import os
+import ssl
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
-from typing import List, Optional, Dict, Any
+from email.mime.nonmultipart import MIMENonMultipart
+from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable
 import logging
 from datetime import datetime
 import json
 
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
 from ..config.settings import (
-    SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD,
-    ENABLE_EMAIL_NOTIFICATIONS
+    SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, SMTP_USE_TLS,
+    SMTP_POOL_SIZE, SMTP_POOL_EXPIRE_SECONDS, ENABLE_EMAIL_NOTIFICATIONS
 )
 
 logger = logging.getLogger(__name__)
 
+# Failures of an SMTP exchange; ssl.SSLError and socket errors are both OSError subclasses
+_SMTP_ERRORS = (aiosmtplib.SMTPException, OSError) if aiosmtplib else (OSError,)
+
+# Rotate a pooled connection after this many messages
+SMTP_MAX_MESSAGES_PER_CONNECTION = 10000
+
+# Connections idle longer than this get a NOOP health check on checkout
+SMTP_NOOP_AFTER_SECONDS = 15
+# How often the pool reaper closes expired idle connections
+SMTP_REAP_INTERVAL_SECONDS = 30
+
+# Notification bodies, filled with str.format_map at send time.
+# The None entry is the generic status update.
+_VIDEO_GENERATION_TEMPLATES = {
+    'completed': ("""
+Video generation completed successfully!
+
+Title: {title}
+Video ID: {video_id}
+Completed at: {now}
+
+Your video is ready for review and upload.
+""", """
+<h2>Video Generation Completed Successfully!</h2>
+<p><strong>Title:</strong> {title}</p>
+<p><strong>Video ID:</strong> {video_id}</p>
+<p><strong>Completed at:</strong> {now}</p>
+<br>
+<p>Your video is ready for review and upload.</p>
+"""),
+    'failed': ("""
+Video generation failed!
+
+Title: {title}
+Video ID: {video_id}
+Failed at: {now}
+Error: {error}
+
+Please check the logs and try again.
+""", """
+<h2>Video Generation Failed!</h2>
+<p><strong>Title:</strong> {title}</p>
+<p><strong>Video ID:</strong> {video_id}</p>
+<p><strong>Failed at:</strong> {now}</p>
+<p><strong>Error:</strong> {error}</p>
+<br>
+<p>Please check the logs and try again.</p>
+"""),
+    None: ("""
+Video generation status update:
+
+Title: {title}
+Video ID: {video_id}
+Status: {status}
+Updated at: {now}
+""", """
+<h2>Video Generation Status Update</h2>
+<p><strong>Title:</strong> {title}</p>
+<p><strong>Video ID:</strong> {video_id}</p>
+<p><strong>Status:</strong> {status}</p>
+<p><strong>Updated at:</strong> {now}</p>
+""")
+}
+
+_UPLOAD_TEMPLATES = {
+    'completed': ("""
+Video upload completed successfully!
+
+Title: {title}
+Platform: {platform}
+Video ID: {video_id}
+Platform Video ID: {platform_video_id}
+Completed at: {now}
+
+Your video is now live on {platform}!
+""", """
+<h2>Video Upload Completed Successfully!</h2>
+<p><strong>Title:</strong> {title}</p>
+<p><strong>Platform:</strong> {platform}</p>
+<p><strong>Video ID:</strong> {video_id}</p>
+<p><strong>Platform Video ID:</strong> {platform_video_id}</p>
+<p><strong>Completed at:</strong> {now}</p>
+<br>
+<p>Your video is now live on {platform}!</p>
+"""),
+    'failed': ("""
+Video upload failed!
+
+Title: {title}
+Platform: {platform}
+Video ID: {video_id}
+Failed at: {now}
+Error: {error}
+
+Please check the logs and try again.
+""", """
+<h2>Video Upload Failed!</h2>
+<p><strong>Title:</strong> {title}</p>
+<p><strong>Platform:</strong> {platform}</p>
+<p><strong>Video ID:</strong> {video_id}</p>
+<p><strong>Failed at:</strong> {now}</p>
+<p><strong>Error:</strong> {error}</p>
+<br>
+<p>Please check the logs and try again.</p>
+"""),
+    None: ("""
+Video upload status update:
+
+Title: {title}
+Platform: {platform}
+Video ID: {video_id}
+Status: {status}
+Updated at: {now}
+""", """
+<h2>Video Upload Status Update</h2>
+<p><strong>Title:</strong> {title}</p>
+<p><strong>Platform:</strong> {platform}</p>
+<p><strong>Video ID:</strong> {video_id}</p>
+<p><strong>Status:</strong> {status}</p>
+<p><strong>Updated at:</strong> {now}</p>
+""")
+}
+
+_SYSTEM_TXT = """
+System Notification
+
+Type: {type}
+Time: {now}
+
+{message}
+"""
+
+_SYSTEM_HTML = """
+<h2>System Notification</h2>
+<p><strong>Type:</strong> {type}</p>
+<p><strong>Time:</strong> {now}</p>
+<br>
+<p>{message}</p>
+"""
+
+_DAILY_SUMMARY_KEYS = (
+    'total_videos', 'completed_videos', 'failed_videos', 'pending_videos',
+    'total_uploads', 'successful_uploads', 'failed_uploads',
+    'active_jobs', 'error_count'
+)
+
+_DAILY_SUMMARY_TXT = """
+Daily Summary Report
+
+Date: {date}
+
+Video Generation:
+- Total videos: {total_videos}
+- Completed: {completed_videos}
+- Failed: {failed_videos}
+- Pending: {pending_videos}
+
+Uploads:
+- Total uploads: {total_uploads}
+- Successful: {successful_uploads}
+- Failed: {failed_uploads}
+
+System Status:
+- Active jobs: {active_jobs}
+- Errors: {error_count}
+"""
+
+_DAILY_SUMMARY_HTML = """
+<h2>Daily Summary Report</h2>
+<p><strong>Date:</strong> {date}</p>
+<br>
+<h3>Video Generation</h3>
+<ul>
+<li>Total videos: {total_videos}</li>
+<li>Completed: {completed_videos}</li>
+<li>Failed: {failed_videos}</li>
+<li>Pending: {pending_videos}</li>
+</ul>
+<br>
+<h3>Uploads</h3>
+<ul>
+<li>Total uploads: {total_uploads}</li>
+<li>Successful: {successful_uploads}</li>
+<li>Failed: {failed_uploads}</li>
+</ul>
+<br>
+<h3>System Status</h3>
+<ul>
+<li>Active jobs: {active_jobs}</li>
+<li>Errors: {error_count}</li>
+</ul>
+"""
+
+class SMTPPool:
+    """Pool of authenticated SMTP connections that are closed after sitting idle."""
+    
+    def __init__(self, connect: Callable[[], Awaitable[Any]], size: int = SMTP_POOL_SIZE,
+                 expire_seconds: float = SMTP_POOL_EXPIRE_SECONDS):
+        self._connect = connect
+        self.size = max(1, size)
+        self.expire_seconds = expire_seconds
+        
+        # Idle (connection, last used, messages sent) entries, most recently used last
+        self._idle: List[Tuple[Any, float, int]] = []
+        
+        # Created lazily on the event loop that first sends
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._reaper: Optional[asyncio.Task] = None
+        
+        # id(connection) -> semaphore its slot was taken from, for connections checked out
+        self._holders: Dict[int, asyncio.Semaphore] = {}
+    
+    def _start(self):
+        """Create the loop-bound primitives and the reaper task on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections and locks belong to the loop that created them, so drop the old loop's
+            if self._reaper is not None:
+                try:
+                    self._reaper.cancel()
+                except RuntimeError:
+                    # The old loop is already closed; its reaper will never run again
+                    pass
+            for conn, _, _ in self._idle:
+                conn.close()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.size)
+            self._idle = []
+            self._reaper = None
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap())
+    
+    async def acquire(self) -> Tuple[Any, int]:
+        """Check out a healthy (connection, messages sent) pair, connecting if none is idle."""
+        self._start()
+        slots = self._slots
+        await slots.acquire()
+        conn = None
+        try:
+            while conn is None:
+                async with self._lock:
+                    if not self._idle:
+                        break
+                    candidate, last_used, uses = self._idle.pop()
+                
+                idle_for = time.monotonic() - last_used
+                if idle_for > self.expire_seconds or not candidate.is_connected:
+                    await self._discard(candidate)
+                    continue
+                
+                if idle_for > SMTP_NOOP_AFTER_SECONDS:
+                    try:
+                        await candidate.noop()
+                    except _SMTP_ERRORS:
+                        await self._discard(candidate)
+                        continue
+                
+                conn = candidate
+            
+            if conn is None:
+                conn, uses = await self._connect(), 0
+        except BaseException:
+            # Includes cancellation, which must not leak the slot either
+            slots.release()
+            raise
+        
+        self._holders[id(conn)] = slots
+        return conn, uses
+    
+    async def release(self, conn, uses: int, reset: bool = False):
+        """Return a connection to the pool, or close it if it is broken or worn out."""
+        slots = self._holders.pop(id(conn), self._slots)
+        if slots is not self._slots:
+            # Checked out on a loop the pool has since left; its semaphore and idle list are gone
+            conn.close()
+            return
+        
+        try:
+            if reset and conn.is_connected:
+                # Abort any half-finished transaction before the next message
+                await conn.rset()
+            if conn.is_connected and uses < SMTP_MAX_MESSAGES_PER_CONNECTION:
+                async with self._lock:
+                    self._idle.append((conn, time.monotonic(), uses))
+                return
+            await self._discard(conn)
+        except _SMTP_ERRORS:
+            conn.close()
+        finally:
+            slots.release()
+    
+    async def _discard(self, conn):
+        """Close a connection, politely if it is still up."""
+        try:
+            if conn.is_connected:
+                await conn.quit()
+        except _SMTP_ERRORS:
+            conn.close()
+    
+    async def _reap(self):
+        """Periodically close idle connections before the server times them out."""
+        while True:
+            await asyncio.sleep(SMTP_REAP_INTERVAL_SECONDS)
+            cutoff = time.monotonic() - self.expire_seconds
+            async with self._lock:
+                expired = [entry[0] for entry in self._idle if entry[1] < cutoff]
+                self._idle = [entry for entry in self._idle if entry[1] >= cutoff]
+            for conn in expired:
+                await self._discard(conn)
+    
+    async def close(self):
+        """Stop the reaper and close all idle connections."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        idle, self._idle = self._idle, []
+        for conn, _, _ in idle:
+            await self._discard(conn)
+
+# One pool per SMTP account, shared by every EmailNotifier instance
+_POOLS: Dict[Tuple[str, int, str], SMTPPool] = {}
+
 class EmailNotifier:
-    """Email notification system using SMTP."""
+    """Email notification system using a pool of authenticated async SMTP connections."""
     
-    def __init__(self):
+    def __init__(self, pool_size: int = SMTP_POOL_SIZE):
         self.smtp_server = SMTP_SERVER
         self.smtp_port = SMTP_PORT
         self.username = SMTP_USERNAME
         self.password = SMTP_PASSWORD
+        self.use_tls = SMTP_USE_TLS
         self.enabled = ENABLE_EMAIL_NOTIFICATIONS
         
+        # Connection pool shared with other notifiers using the same account
+        pool_key = (self.smtp_server, self.smtp_port, self.username)
+        if pool_key not in _POOLS:
+            _POOLS[pool_key] = SMTPPool(self._connect, pool_size)
+        self._pool = _POOLS[pool_key]
+        
         if not self.enabled:
             logger.info("Email notifications are disabled")
             return
         
+        if aiosmtplib is None:
+            logger.warning("aiosmtplib is not installed. Email notifications will not work.")
+            self.enabled = False
+            return
+        
         # Validate configuration
         if not all([self.smtp_server, self.smtp_port, self.username, self.password]):
             logger.warning("Email configuration incomplete. Email notifications will not work.")
             self.enabled = False
         else:
+            # Built once so new pool connections skip loading the CA bundle again
+            self._tls_context = ssl.create_default_context()
             logger.info("Email notifier initialized successfully")
     
-    def send_email(self, to_emails: List[str], subject: str, body: str,
-                  html_body: Optional[str] = None, attachments: List[str] = None) -> bool:
+    async def _connect(self):
+        """Open a new authenticated SMTP connection."""
+        conn = aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            start_tls=self.use_tls,
+            tls_context=self._tls_context
+        )
+        await conn.connect()
+        try:
+            await conn.login(self.username, self.password)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+    
+    async def close(self):
+        """Close the pooled SMTP connections."""
+        await self._pool.close()
+    
+    def _build_message(self, to_emails: List[str], subject: str, body: str,
+                       html_body: Optional[str] = None,
+                       attachments: List[str] = None) -> MIMEBase:
+        """Build the MIME message for send_email."""
+        # Plain text body, wrapped in an alternative part only when there is an HTML version
+        text_part = MIMEText(body, 'plain')
+        if html_body:
+            body_part = MIMEMultipart('alternative')
+            body_part.attach(text_part)
+            body_part.attach(MIMEText(html_body, 'html'))
+        else:
+            body_part = text_part
+        
+        if attachments:
+            msg = MIMEMultipart('mixed')
+            msg.attach(body_part)
+            for attachment_path in attachments:
+                self._add_attachment(msg, attachment_path)
+        else:
+            msg = body_part
+        
+        msg['From'] = self.username
+        msg['To'] = ', '.join(to_emails)
+        msg['Subject'] = subject
+        
+        return msg
+    
+    async def _deliver(self, conn, msg: MIMEBase):
         """
-        Send an email notification.
+        Send msg on conn through aiosmtplib's public send_message.
+        
+        Like smtplib, refused recipients are logged and skipped; the message
+        only fails (SMTPRecipientsRefused) if every recipient is refused.
+        """
+        refused, _ = await conn.send_message(msg)
+        if refused:
+            logger.warning(f"Recipients refused: {', '.join(f'{addr} ({reply.code} {reply.message})' for addr, reply in refused.items())}")
+    
+    async def send_email(self, to_emails: List[str], subject: str, body: str,
+                         html_body: Optional[str] = None, attachments: List[str] = None) -> bool:
+        """
+        Send an email notification over a pooled SMTP connection.
         
         Args:
             to_emails: List of recipient email addresses
@@ -60,57 +466,108 @@ class EmailNotifier:
             return False
         
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.username
-            msg['To'] = ', '.join(to_emails)
-            msg['Subject'] = subject
-            
-            # Add plain text body
-            text_part = MIMEText(body, 'plain')
-            msg.attach(text_part)
+            msg = self._build_message(to_emails, subject, body, html_body, attachments)
             
-            # Add HTML body if provided
-            if html_body:
-                html_part = MIMEText(html_body, 'html')
-                msg.attach(html_part)
-            
-            # Add attachments
-            if attachments:
-                for attachment_path in attachments:
-                    self._add_attachment(msg, attachment_path)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            conn, uses = await self._pool.acquire()
+            try:
+                conn, uses = await self._deliver_with_reconnect(conn, uses, msg)
+            except BaseException:
+                await self._pool.release(conn, uses, reset=True)
+                raise
+            await self._pool.release(conn, uses)
             
             logger.info(f"Email sent successfully to {len(to_emails)} recipients: {subject}")
             return True
             
+        except _SMTP_ERRORS as e:
+            logger.error(f"Failed to send email: {e}")
+            return False
         except Exception as e:
+            # e.g. a MIME encoding error; a notification must never take its caller down
             logger.error(f"Failed to send email: {e}")
             return False
     
+    async def send_many(self, jobs: List[Tuple[List[str], str, str, Optional[str]]]) -> int:
+        """
+        Send several emails over a single pooled SMTP connection.
+        
+        Args:
+            jobs: (to_emails, subject, body, html_body) tuples, one per email
+        
+        Returns:
+            Number of emails sent successfully
+        """
+        if not self.enabled:
+            logger.warning("Email notifications are disabled")
+            return 0
+        
+        if not jobs:
+            return 0
+        
+        sent = 0
+        try:
+            conn, uses = await self._pool.acquire()
+        except _SMTP_ERRORS as e:
+            logger.error(f"Failed to send {len(jobs)} emails: {e}")
+            return 0
+        
+        try:
+            for to_emails, subject, body, html_body in jobs:
+                try:
+                    msg = self._build_message(to_emails, subject, body, html_body)
+                    conn, uses = await self._deliver_with_reconnect(conn, uses, msg)
+                    sent += 1
+                except _SMTP_ERRORS as e:
+                    logger.error(f"Failed to send email '{subject}': {e}")
+                    if conn.is_connected:
+                        # Clear the failed transaction so the next message starts clean
+                        try:
+                            await conn.rset()
+                        except _SMTP_ERRORS:
+                            # The server is already gone; the next job reconnects
+                            conn.close()
+                except Exception as e:
+                    # Building the message failed, so nothing was sent on the connection
+                    logger.error(f"Failed to send email '{subject}': {e}")
+        finally:
+            await self._pool.release(conn, uses)
+        
+        logger.info(f"Sent {sent}/{len(jobs)} emails over one connection")
+        return sent
+    
+    async def _deliver_with_reconnect(self, conn, uses: int, msg: MIMEBase):
+        """Deliver msg, reconnecting once if the server dropped the connection; returns (connection, messages sent)."""
+        try:
+            await self._deliver(conn, msg)
+        except aiosmtplib.SMTPServerDisconnected:
+            # The server dropped the pooled connection; reconnect once and retry
+            conn.close()
+            conn, uses = await self._connect(), 0
+            try:
+                await self._deliver(conn, msg)
+            except BaseException:
+                # The caller still holds the old connection, so this one would never be released
+                await self._pool._discard(conn)
+                raise
+        return conn, uses + 1
+    
     def _add_attachment(self, msg: MIMEMultipart, file_path: str):
         """Add a file attachment to the email."""
         try:
             with open(file_path, 'rb') as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
+                # One C-level encodebytes pass instead of encoders.encode_base64 on a MIMEBase payload
+                encoded = base64.encodebytes(attachment.read()).decode('ascii')
             
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename= {file_path.split("/")[-1]}'
-            )
+            part = MIMENonMultipart('application', 'octet-stream')
+            part.set_payload(encoded)
+            part['Content-Transfer-Encoding'] = 'base64'
+            part.add_header('Content-Disposition', 'attachment', filename=os.path.basename(file_path))
             msg.attach(part)
             
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Failed to add attachment {file_path}: {e}")
     
-    def send_video_generation_notification(self, to_emails: List[str], video_title: str,
+    async def send_video_generation_notification(self, to_emails: List[str], video_title: str,
                                          status: str, video_id: int, 
                                          error_message: Optional[str] = None) -> bool:
         """
@@ -128,64 +585,18 @@ class EmailNotifier:
         """
         subject = f"Video Generation {status.title()}: {video_title}"
         
-        if status == 'completed':
-            body = f"""
-Video generation completed successfully!
-
-Title: {video_title}
-Video ID: {video_id}
-Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-Your video is ready for review and upload.
-"""
-            html_body = f"""
-<h2>Video Generation Completed Successfully!</h2>
-<p><strong>Title:</strong> {video_title}</p>
-<p><strong>Video ID:</strong> {video_id}</p>
-<p><strong>Completed at:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-<br>
-<p>Your video is ready for review and upload.</p>
-"""
-        elif status == 'failed':
-            body = f"""
-Video generation failed!
-
-Title: {video_title}
-Video ID: {video_id}
-Failed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Error: {error_message or 'Unknown error'}
-
-Please check the logs and try again.
-"""
-            html_body = f"""
-<h2>Video Generation Failed!</h2>
-<p><strong>Title:</strong> {video_title}</p>
-<p><strong>Video ID:</strong> {video_id}</p>
-<p><strong>Failed at:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-<p><strong>Error:</strong> {error_message or 'Unknown error'}</p>
-<br>
-<p>Please check the logs and try again.</p>
-"""
-        else:
-            body = f"""
-Video generation status update:
-
-Title: {video_title}
-Video ID: {video_id}
-Status: {status}
-Updated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-            html_body = f"""
-<h2>Video Generation Status Update</h2>
-<p><strong>Title:</strong> {video_title}</p>
-<p><strong>Video ID:</strong> {video_id}</p>
-<p><strong>Status:</strong> {status}</p>
-<p><strong>Updated at:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-"""
+        body, html_body = _VIDEO_GENERATION_TEMPLATES.get(status, _VIDEO_GENERATION_TEMPLATES[None])
+        fields = {
+            'title': video_title,
+            'video_id': video_id,
+            'status': status,
+            'now': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'error': error_message or 'Unknown error'
+        }
         
-        return self.send_email(to_emails, subject, body, html_body)
+        return await self.send_email(to_emails, subject, body.format_map(fields), html_body.format_map(fields))
     
-    def send_upload_notification(self, to_emails: List[str], video_title: str,
+    async def send_upload_notification(self, to_emails: List[str], video_title: str,
                                platform: str, status: str, video_id: int,
                                platform_video_id: Optional[str] = None,
                                error_message: Optional[str] = None) -> bool:
@@ -206,72 +617,20 @@ Updated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """
         subject = f"Video Upload {status.title()} to {platform}: {video_title}"
         
-        if status == 'completed':
-            body = f"""
-Video upload completed successfully!
-
-Title: {video_title}
-Platform: {platform}
-Video ID: {video_id}
-Platform Video ID: {platform_video_id or 'N/A'}
-Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-Your video is now live on {platform}!
-"""
-            html_body = f"""
-<h2>Video Upload Completed Successfully!</h2>
-<p><strong>Title:</strong> {video_title}</p>
-<p><strong>Platform:</strong> {platform}</p>
-<p><strong>Video ID:</strong> {video_id}</p>
-<p><strong>Platform Video ID:</strong> {platform_video_id or 'N/A'}</p>
-<p><strong>Completed at:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-<br>
-<p>Your video is now live on {platform}!</p>
-"""
-        elif status == 'failed':
-            body = f"""
-Video upload failed!
-
-Title: {video_title}
-Platform: {platform}
-Video ID: {video_id}
-Failed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Error: {error_message or 'Unknown error'}
-
-Please check the logs and try again.
-"""
-            html_body = f"""
-<h2>Video Upload Failed!</h2>
-<p><strong>Title:</strong> {video_title}</p>
-<p><strong>Platform:</strong> {platform}</p>
-<p><strong>Video ID:</strong> {video_id}</p>
-<p><strong>Failed at:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-<p><strong>Error:</strong> {error_message or 'Unknown error'}</p>
-<br>
-<p>Please check the logs and try again.</p>
-"""
-        else:
-            body = f"""
-Video upload status update:
-
-Title: {video_title}
-Platform: {platform}
-Video ID: {video_id}
-Status: {status}
-Updated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-            html_body = f"""
-<h2>Video Upload Status Update</h2>
-<p><strong>Title:</strong> {video_title}</p>
-<p><strong>Platform:</strong> {platform}</p>
-<p><strong>Video ID:</strong> {video_id}</p>
-<p><strong>Status:</strong> {status}</p>
-<p><strong>Updated at:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-"""
+        body, html_body = _UPLOAD_TEMPLATES.get(status, _UPLOAD_TEMPLATES[None])
+        fields = {
+            'title': video_title,
+            'platform': platform,
+            'video_id': video_id,
+            'platform_video_id': platform_video_id or 'N/A',
+            'status': status,
+            'now': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'error': error_message or 'Unknown error'
+        }
         
-        return self.send_email(to_emails, subject, body, html_body)
+        return await self.send_email(to_emails, subject, body.format_map(fields), html_body.format_map(fields))
     
-    def send_system_notification(self, to_emails: List[str], subject: str,
+    async def send_system_notification(self, to_emails: List[str], subject: str,
                                message: str, notification_type: str = 'info') -> bool:
         """
         Send a general system notification.
@@ -288,26 +647,15 @@ Updated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         # Add notification type to subject
         subject = f"[{notification_type.upper()}] {subject}"
         
-        body = f"""
-System Notification
-
-Type: {notification_type.title()}
-Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-{message}
-"""
-        
-        html_body = f"""
-<h2>System Notification</h2>
-<p><strong>Type:</strong> {notification_type.title()}</p>
-<p><strong>Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-<br>
-<p>{message}</p>
-"""
+        fields = {
+            'type': notification_type.title(),
+            'now': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'message': message
+        }
         
-        return self.send_email(to_emails, subject, body, html_body)
+        return await self.send_email(to_emails, subject, _SYSTEM_TXT.format_map(fields), _SYSTEM_HTML.format_map(fields))
     
-    def send_daily_summary(self, to_emails: List[str], summary_data: Dict[str, Any]) -> bool:
+    async def send_daily_summary(self, to_emails: List[str], summary_data: Dict[str, Any]) -> bool:
         """
         Send a daily summary of video generation and upload activities.
         
@@ -318,71 +666,25 @@ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         Returns:
             True if successful, False otherwise
         """
-        subject = f"Daily Summary - {datetime.now().strftime('%Y-%m-%d')}"
+        today = datetime.now().strftime('%Y-%m-%d')
+        subject = f"Daily Summary - {today}"
         
-        # Build summary text
-        body = f"""
-Daily Summary Report
-
-Date: {datetime.now().strftime('%Y-%m-%d')}
-
-Video Generation:
-- Total videos: {summary_data.get('total_videos', 0)}
-- Completed: {summary_data.get('completed_videos', 0)}
-- Failed: {summary_data.get('failed_videos', 0)}
-- Pending: {summary_data.get('pending_videos', 0)}
-
-Uploads:
-- Total uploads: {summary_data.get('total_uploads', 0)}
-- Successful: {summary_data.get('successful_uploads', 0)}
-- Failed: {summary_data.get('failed_uploads', 0)}
-
-System Status:
-- Active jobs: {summary_data.get('active_jobs', 0)}
-- Errors: {summary_data.get('error_count', 0)}
-"""
+        fields = {key: summary_data.get(key, 0) for key in _DAILY_SUMMARY_KEYS}
+        fields['date'] = today
         
-        # Build HTML summary
-        html_body = f"""
-<h2>Daily Summary Report</h2>
-<p><strong>Date:</strong> {datetime.now().strftime('%Y-%m-%d')}</p>
-<br>
-<h3>Video Generation</h3>
-<ul>
-<li>Total videos: {summary_data.get('total_videos', 0)}</li>
-<li>Completed: {summary_data.get('completed_videos', 0)}</li>
-<li>Failed: {summary_data.get('failed_videos', 0)}</li>
-<li>Pending: {summary_data.get('pending_videos', 0)}</li>
-</ul>
-<br>
-<h3>Uploads</h3>
-<ul>
-<li>Total uploads: {summary_data.get('total_uploads', 0)}</li>
-<li>Successful: {summary_data.get('successful_uploads', 0)}</li>
-<li>Failed: {summary_data.get('failed_uploads', 0)}</li>
-</ul>
-<br>
-<h3>System Status</h3>
-<ul>
-<li>Active jobs: {summary_data.get('active_jobs', 0)}</li>
-<li>Errors: {summary_data.get('error_count', 0)}</li>
-</ul>
-"""
-        
-        return self.send_email(to_emails, subject, body, html_body)
+        return await self.send_email(to_emails, subject, _DAILY_SUMMARY_TXT.format_map(fields), _DAILY_SUMMARY_HTML.format_map(fields))
     
-    def test_connection(self) -> bool:
+    async def test_connection(self) -> bool:
         """Test SMTP connection and authentication."""
         if not self.enabled:
             return False
         
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
+            conn = await self._connect()
+            await conn.quit()
             logger.info("SMTP connection test successful")
             return True
-        except Exception as e:
+        except _SMTP_ERRORS as e:
             logger.error(f"SMTP connection test failed: {e}")
             return False
 
@@ -4,26 +4,43 @@ Automatically picks up scheduled tasks from database and starts processing
 """
 
 import asyncio
+import contextlib
 import logging
+import os
+import sqlite3
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.date import DateTrigger
+from concurrent.futures import ProcessPoolExecutor
 
 from src.database.db_handler import (
     get_scheduled_videos, 
-    get_videos_ready_for_processing,
+    claim_ready_videos,
+    close_poll_connections,
+    get_next_scheduled_time,
+    get_upcoming_videos,
+    open_change_watch,
+    get_data_version,
     update_video_status,
     get_video_by_id
 )
+from src.config.settings import NOTIFICATION_EMAILS
+from src.notifications.email_notifier import email_notifier
 
 logger = logging.getLogger(__name__)
 
+async def _run_db(fn: Callable, *args):
+    """Run a blocking db_handler call in the default executor so it never stalls the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
 @dataclass
 class ScheduledTask:
     """Represents a scheduled video generation task"""
+    # No per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('video_id', 'title', 'description', 'genre', 'expected_length',
+                 'schedule_time', 'status', 'metadata')
+    
     video_id: int
     title: str
     description: str
@@ -39,30 +56,55 @@ class EnhancedScheduler:
     """
     
     def __init__(self, workflow_callback: Optional[Callable] = None):
-        self.scheduler = AsyncIOScheduler()
         self.workflow_callback = workflow_callback
         self.monitoring_task = None
+        self.watch_task = None
         self.is_running = False
         
         # Configuration
-        self.check_interval = 60  # Check database every 60 seconds
+        # Re-check backoff while due videos are still waiting: min_interval after a hit, growing to max_interval
+        self.min_interval = 1.0
+        self.max_interval = 60.0
+        self.backoff_factor = 1.5
+        self.max_sleep = 300  # Longest idle sleep before re-checking the database
+        self.change_poll_interval = 1.0  # How often to look for commits from other processes
         self.max_concurrent_tasks = 3
         self.active_tasks: Dict[int, ScheduledTask] = {}
+        # Dashboard view of active_tasks, serialized once when a task starts
+        self._active_tasks_serialized: Dict[int, Dict[str, Any]] = {}
+        
+        # Short-lived caches for dashboard polling of jobs and stats: (monotonic time, value)
+        self.stats_ttl = 1.0
+        self._jobs_cache = None
+        self._stats_cache = None
+        
+        # Caps how many videos are processed at once
+        self._slots = asyncio.Semaphore(self.max_concurrent_tasks)
+        # Processing task per video; entries are dropped only by the task's done callback
+        self._processing_tasks: Dict[int, asyncio.Task] = {}
+        
+        # Set by schedule_video to cut the monitoring sleep short
+        self._wakeup = asyncio.Event()
+        
+        # In-flight email notifications, kept so they are not garbage collected mid-send
+        self._notification_tasks = set()
+        
+        # Worker processes for CPU-bound workflow stages, created on first run_cpu call
+        self.cpu_workers = os.cpu_count() or 1
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
         
         logger.info("📅 Enhanced Scheduler initialized")
     
     async def start(self):
         """Start the enhanced scheduler"""
         try:
-            # Start the APScheduler
-            self.scheduler.start()
-            
-            # Start the database monitoring task
+            # Start the database monitoring task; the videos table is the only schedule
             self.is_running = True
             self.monitoring_task = asyncio.create_task(self._monitor_database())
+            self.watch_task = asyncio.create_task(self._watch_database_changes())
             
             logger.info("✅ Enhanced Scheduler started successfully")
-            logger.info(f"   📊 Monitoring database every {self.check_interval} seconds")
+            logger.info(f"   📊 Monitoring database until the next due video (at most every {self.max_sleep} seconds)")
             logger.info(f"   🎯 Max concurrent tasks: {self.max_concurrent_tasks}")
             
         except Exception as e:
@@ -74,16 +116,36 @@ class EnhancedScheduler:
         try:
             self.is_running = False
             
-            # Stop the monitoring task
-            if self.monitoring_task:
-                self.monitoring_task.cancel()
-                try:
-                    await self.monitoring_task
-                except asyncio.CancelledError:
-                    pass
+            # Stop the monitoring and change watching tasks
+            for background_task in (self.monitoring_task, self.watch_task):
+                if background_task:
+                    background_task.cancel()
+                    try:
+                        await background_task
+                    except asyncio.CancelledError:
+                        pass
+                    except Exception as e:
+                        # A task that already died must not keep the rest of shutdown from running
+                        logger.error(f"❌ Background scheduler task failed: {e}")
             
-            # Stop the APScheduler
-            self.scheduler.shutdown()
+            # Cancel videos still being processed
+            for task in list(self._processing_tasks.values()):
+                task.cancel()
+            if self._processing_tasks:
+                await asyncio.gather(*self._processing_tasks.values(), return_exceptions=True)
+            
+            # Let in-flight notifications finish, then close the SMTP pool
+            if self._notification_tasks:
+                await asyncio.gather(*self._notification_tasks, return_exceptions=True)
+            await email_notifier.close()
+            
+            # Release the executor threads' poll connections
+            close_poll_connections()
+            
+            # Let CPU-bound work finish without blocking the event loop
+            if self._cpu_pool is not None:
+                await asyncio.get_running_loop().run_in_executor(None, self._cpu_pool.shutdown)
+                self._cpu_pool = None
             
             logger.info("🛑 Enhanced Scheduler stopped")
             
@@ -94,82 +156,196 @@ class EnhancedScheduler:
         """Continuously monitor database for scheduled tasks"""
         logger.info("🔍 Starting database monitoring...")
         
+        poll_interval = self.min_interval
         while self.is_running:
             try:
-                await self._check_for_scheduled_tasks()
-                await asyncio.sleep(self.check_interval)
+                # Back off while polls start nothing, snap back as soon as one does
+                if await self._check_for_scheduled_tasks():
+                    poll_interval = self.min_interval
+                else:
+                    poll_interval = min(poll_interval * self.backoff_factor, self.max_interval)
+                
+                # Sleep until the next video is due, unless a new one is scheduled first
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=await self._next_poll_delay(poll_interval))
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
                 
             except asyncio.CancelledError:
                 logger.info("🛑 Database monitoring cancelled")
                 break
             except Exception as e:
                 logger.error(f"❌ Error in database monitoring: {e}")
-                await asyncio.sleep(self.check_interval)
+                await asyncio.sleep(self.max_interval)
     
-    async def _check_for_scheduled_tasks(self):
-        """Check database for scheduled tasks and trigger processing"""
+    async def _watch_database_changes(self):
+        """Wake the monitor when another connection commits, e.g. a video saved from the UI process"""
+        # SQLite has no LISTEN/NOTIFY; PRAGMA data_version is the cheap equivalent and never touches the videos table
         try:
-            # Get videos ready for processing (past schedule time)
-            ready_videos = get_videos_ready_for_processing()
-            
-            for video_data in ready_videos:
-                if video_data['id'] not in self.active_tasks:
-                    # Create scheduled task
-                    scheduled_task = ScheduledTask(
-                        video_id=video_data['id'],
-                        title=video_data['title'],
-                        description=video_data['description'],
-                        genre=video_data['genre'],
-                        expected_length=video_data['expected_length'],
-                        schedule_time=datetime.fromisoformat(video_data['schedule_time']),
-                        status=video_data['status'],
-                        metadata=video_data.get('extra_metadata', {})
-                    )
-                    
-                    # Add to active tasks
-                    self.active_tasks[video_data['id']] = scheduled_task
-                    
-                    # Trigger workflow callback if available
-                    if self.workflow_callback:
-                        logger.info(f"🚀 Triggering automated processing for video {video_data['id']}")
-                        try:
-                            # Start processing immediately - skip image generation
-                            await self._start_automated_processing(scheduled_task)
-                        except Exception as e:
-                            logger.error(f"❌ Error starting automated processing for video {video_data['id']}: {e}")
-                            # Remove from active tasks on error
-                            if video_data['id'] in self.active_tasks:
-                                del self.active_tasks[video_data['id']]
-                    else:
-                        logger.warning(f"⚠️ No workflow callback available for video {video_data['id']}")
-                        
-        except Exception as e:
-            logger.error(f"❌ Error checking for scheduled tasks: {e}")
+            conn = await _run_db(open_change_watch)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Could not watch database for changes, relying on polling every {self.max_sleep} seconds: {e}")
+            return
+        try:
+            try:
+                last_version = await _run_db(get_data_version, conn)
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Could not watch database for changes, relying on polling every {self.max_sleep} seconds: {e}")
+                return
+            while self.is_running:
+                await asyncio.sleep(self.change_poll_interval)
+                try:
+                    version = await _run_db(get_data_version, conn)
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ Error watching database for changes: {e}")
+                    continue
+                if version != last_version:
+                    last_version = version
+                    self._wakeup.set()
+        finally:
+            conn.close()
     
-    async def _start_automated_processing(self, scheduled_task: ScheduledTask):
-        """Start automated processing for a scheduled task - skip image generation"""
+    async def _next_poll_delay(self, poll_interval: float) -> float:
+        """Seconds until the earliest pending video is due, or poll_interval if one is already waiting; capped at max_sleep"""
+        next_due = await _run_db(get_next_scheduled_time)
+        if next_due is None:
+            return self.max_sleep
+        
+        # Local time, the same clock the claim query uses via datetime('now', 'localtime')
+        delay = (next_due - datetime.now()).total_seconds()
+        if delay <= 0:
+            # Already due but still pending (e.g. all slots busy); fall back to backoff polling
+            delay = poll_interval
+        return max(self.min_interval, min(self.max_sleep, delay))
+    
+    async def _check_for_scheduled_tasks(self) -> int:
+        """Check database for scheduled tasks and trigger processing; returns how many were started"""
+        # Nothing to fetch while every processing slot is taken
+        free_slots = self.max_concurrent_tasks - len(self.active_tasks)
+        if free_slots <= 0:
+            return 0
+        
+        if not self.workflow_callback:
+            # Leave due videos pending rather than claiming work nothing can run
+            logger.warning("⚠️ No workflow callback available, not claiming scheduled videos")
+            return 0
+        
         try:
-            logger.info(f"🤖 Starting automated processing for video {scheduled_task.video_id}")
-            
-            # Skip image generation and video assembly - go directly to upload
-            # Update status to uploading immediately
-            update_video_status(scheduled_task.video_id, "uploading")
+            # Claim due videos in one transaction; they come back already marked as uploading
+            claimed = await _run_db(claim_ready_videos, free_slots)
+        except sqlite3.Error as e:
+            logger.error(f"❌ Error claiming scheduled videos: {e}")
+            return 0
+        
+        admitted = []
+        for video_data in claimed:
+            # Already a dict from db_handler; the stored video file wins over a link in the form metadata
+            metadata = video_data['extra_metadata']
+            if video_data['video_url']:
+                metadata['video_link'] = video_data['video_url']
             
-            logger.info(f"⏭️ Skipped image generation and video assembly for video {scheduled_task.video_id}")
-            logger.info(f"📤 Moving directly to YouTube upload for video {scheduled_task.video_id}")
+            admitted.append(ScheduledTask(
+                video_id=video_data['id'],
+                title=video_data['title'],
+                description=video_data['description'],
+                genre=video_data['genre'],
+                expected_length=video_data['expected_length'],
+                schedule_time=video_data['schedule_time'],  # already a datetime from db_handler
+                status=video_data['status'],
+                metadata=metadata
+            ))
+        
+        if admitted:
+            # Claimed videos left the pending listing and joined the active count
+            self._jobs_cache = self._stats_cache = None
+        
+        for scheduled_task in admitted:
+            video_id = scheduled_task.video_id
+            self.active_tasks[video_id] = scheduled_task
+            self._active_tasks_serialized[video_id] = {
+                'video_id': video_id,
+                'title': scheduled_task.title,
+                'description': scheduled_task.description,
+                'genre': scheduled_task.genre,
+                'schedule_time': scheduled_task.schedule_time.isoformat() if scheduled_task.schedule_time else None,
+                'status': scheduled_task.status,
+                'expected_length': scheduled_task.expected_length
+            }
             
-            # If workflow callback is available, trigger it
-            if self.workflow_callback:
-                await self.workflow_callback(scheduled_task)
-            else:
-                logger.warning(f"⚠️ No workflow callback available for video {scheduled_task.video_id}")
-                
+            # Start processing in the background; the semaphore caps how many run at once
+            logger.info(f"🚀 Triggering automated processing for video {video_id}")
+            task = asyncio.create_task(self._start_automated_processing(scheduled_task))
+            self._processing_tasks[video_id] = task
+            task.add_done_callback(lambda t, vid=video_id: self._on_processing_done(t, vid))
+        
+        return len(admitted)
+    
+    def _on_processing_done(self, task: asyncio.Task, video_id: int):
+        """Free the slot of a finished processing task and wake the monitor to fill it"""
+        self._processing_tasks.pop(video_id, None)
+        self.active_tasks.pop(video_id, None)
+        self._active_tasks_serialized.pop(video_id, None)
+        self._stats_cache = None
+        if not task.cancelled():
+            # Mark the exception retrieved; _video_lifecycle already logged it
+            task.exception()
+        self._wakeup.set()
+    
+    async def run_cpu(self, fn: Callable, *args):
+        """Run a CPU-bound workflow stage (rendering, encoding) in a worker process so uploads keep flowing"""
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return await asyncio.get_running_loop().run_in_executor(self._cpu_pool, fn, *args)
+    
+    def _notify(self, send_fn: Callable, *args):
+        """Send an email notification in the background so SMTP never stalls the monitoring loop"""
+        if not NOTIFICATION_EMAILS:
+            return
+        
+        task = asyncio.create_task(send_fn(NOTIFICATION_EMAILS, *args))
+        self._notification_tasks.add(task)
+        task.add_done_callback(self._on_notification_done)
+    
+    def _on_notification_done(self, task: asyncio.Task):
+        """Forget a finished notification, logging anything the notifier let escape (e.g. a template error)"""
+        self._notification_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"❌ Error sending notification: {task.exception()}")
+    
+    @contextlib.asynccontextmanager
+    async def _video_lifecycle(self, scheduled_task: ScheduledTask, failure: str = "failed"):
+        """Write the failure status exactly once if the wrapped block raises; success needs no write"""
+        try:
+            yield
         except Exception as e:
             logger.error(f"❌ Error starting automated processing for video {scheduled_task.video_id}: {e}")
-            # Mark as failed if we can't start processing
-            update_video_status(scheduled_task.video_id, "failed")
+            await _run_db(update_video_status, scheduled_task.video_id, failure)
+            self._notify(
+                email_notifier.send_video_generation_notification,
+                scheduled_task.title, failure, scheduled_task.video_id, str(e)
+            )
             raise
     
+    async def _start_automated_processing(self, scheduled_task: ScheduledTask):
+        """Start automated processing for a scheduled task - skip image generation"""
+        async with self._slots, self._video_lifecycle(scheduled_task):
+            await self._run_automated_processing(scheduled_task)
+    
+    async def _run_automated_processing(self, scheduled_task: ScheduledTask):
+        """Upload a scheduled video through the workflow callback"""
+        logger.info(f"🤖 Starting automated processing for video {scheduled_task.video_id}")
+        
+        # Status was already set to uploading when the batch was claimed
+        logger.info(f"⏭️ Skipped image generation and video assembly for video {scheduled_task.video_id}")
+        logger.info(f"📤 Moving directly to YouTube upload for video {scheduled_task.video_id}")
+        
+        # If workflow callback is available, trigger it
+        if self.workflow_callback:
+            await self.workflow_callback(scheduled_task)
+        else:
+            logger.warning(f"⚠️ No workflow callback available for video {scheduled_task.video_id}")
+    
     async def schedule_video(self, video_data: Dict[str, Any]) -> bool:
         """Schedule a video for future processing"""
         try:
@@ -180,111 +356,77 @@ class EnhancedScheduler:
                 logger.warning(f"⚠️ No schedule time for video {video_id}")
                 return False
             
-            # Parse schedule time if it's a string
-            if isinstance(schedule_time, str):
+            # Parse schedule time only if it isn't a datetime already
+            if not isinstance(schedule_time, datetime):
                 try:
                     schedule_time = datetime.fromisoformat(schedule_time)
-                except:
+                except (TypeError, ValueError):
                     logger.error(f"❌ Invalid schedule time format for video {video_id}: {schedule_time}")
                     return False
             
-            # Create APScheduler job
-            job_id = f"video_{video_id}_{int(schedule_time.timestamp())}"
-            
-            self.scheduler.add_job(
-                func=self._execute_scheduled_video,
-                trigger=DateTrigger(run_date=schedule_time),
-                args=[video_id],
-                id=job_id,
-                name=f"Video {video_id}: {video_data['title']}",
-                max_instances=1
-            )
-            
+            # The row is already persisted; the monitor loop picks it up when it is due
             logger.info(f"📅 Scheduled video {video_id} for {schedule_time}")
+            
+            # Wake the monitoring loop so the new due time is taken into account immediately
+            self._wakeup.set()
+            self._jobs_cache = self._stats_cache = None
             return True
             
-        except Exception as e:
-            logger.error(f"❌ Failed to schedule video: {e}")
+        except KeyError as e:
+            logger.error(f"❌ Failed to schedule video: missing field {e}")
             return False
     
-    async def _execute_scheduled_video(self, video_id: int):
-        """Execute a scheduled video (called by APScheduler)"""
-        try:
-            logger.info(f"🎬 Executing scheduled video {video_id}")
-            
-            # Get current video data
-            video_data = get_video_by_id(video_id)
-            if not video_data:
-                logger.error(f"❌ Video {video_id} not found")
-                return
-            
-            # Check if it's ready to process
-            if video_data['status'] == 'pending':
-                await self._process_scheduled_video(video_data)
-            else:
-                logger.info(f"⚠️ Video {video_id} status is {video_data['status']}, skipping")
-                
-        except Exception as e:
-            logger.error(f"❌ Error executing scheduled video {video_id}: {e}")
-    
     def get_scheduled_jobs(self) -> List[Dict[str, Any]]:
-        """Get all scheduled jobs from APScheduler"""
+        """Get all pending scheduled videos from the database (cached for stats_ttl seconds)"""
+        if self._jobs_cache and time.monotonic() - self._jobs_cache[0] < self.stats_ttl:
+            return self._jobs_cache[1]
+        
         try:
-            jobs = []
-            for job in self.scheduler.get_jobs():
-                jobs.append({
-                    'job_id': job.id,
-                    'name': job.name,
-                    'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
-                    'trigger': str(job.trigger)
-                })
+            jobs = [
+                {
+                    'job_id': f"video_{video['id']}",
+                    'name': f"Video {video['id']}: {video['title']}",
+                    'next_run_time': video['schedule_time'].isoformat() if video['schedule_time'] else None,
+                    'trigger': 'schedule_time'
+                }
+                for video in get_upcoming_videos()
+            ]
+            self._jobs_cache = (time.monotonic(), jobs)
             return jobs
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"❌ Error getting scheduled jobs: {e}")
             return []
     
     def get_active_tasks(self) -> List[Dict[str, Any]]:
         """Get currently active processing tasks"""
-        try:
-            tasks = []
-            for video_id, task in self.active_tasks.items():
-                tasks.append({
-                    'video_id': video_id,
-                    'title': task.title,
-                    'description': task.description,
-                    'genre': task.genre,
-                    'schedule_time': task.schedule_time.isoformat() if task.schedule_time else None,
-                    'status': task.status,
-                    'expected_length': task.expected_length
-                })
-            return tasks
-        except Exception as e:
-            logger.error(f"❌ Error getting active tasks: {e}")
-            return []
+        return list(self._active_tasks_serialized.values())
     
     def get_scheduler_stats(self) -> Dict[str, Any]:
-        """Get scheduler statistics"""
-        try:
-            return {
-                'is_running': self.is_running,
-                'active_task_count': len(self.active_tasks),
-                'max_concurrent_tasks': self.max_concurrent_tasks,
-                'scheduled_job_count': len(self.scheduler.get_jobs()),
-                'check_interval_seconds': self.check_interval
-            }
-        except Exception as e:
-            logger.error(f"❌ Error getting scheduler stats: {e}")
-            return {}
+        """Get scheduler statistics (cached for stats_ttl seconds)"""
+        if self._stats_cache and time.monotonic() - self._stats_cache[0] < self.stats_ttl:
+            return self._stats_cache[1]
+        
+        stats = {
+            'is_running': self.is_running,
+            'active_task_count': len(self.active_tasks),
+            'max_concurrent_tasks': self.max_concurrent_tasks,
+            # Reuse the job listing so both calls share one query per TTL window
+            'scheduled_job_count': len(self.get_scheduled_jobs()),
+            'check_interval_seconds': self.max_interval
+        }
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
     
     async def cancel_video_processing(self, video_id: int) -> bool:
         """Cancel processing of a specific video"""
         try:
-            if video_id in self.active_tasks:
+            task = self._processing_tasks.get(video_id)
+            if task:
                 # Update status to cancelled
-                update_video_status(video_id, 'cancelled')
+                await _run_db(update_video_status, video_id, 'cancelled')
                 
-                # Remove from active tasks
-                del self.active_tasks[video_id]
+                # Stop the upload; the done callback removes it from active tasks
+                task.cancel()
                 
                 logger.info(f"🚫 Cancelled processing for video {video_id}")
                 return True
@@ -292,7 +434,7 @@ class EnhancedScheduler:
                 logger.warning(f"⚠️ Video {video_id} not in active tasks")
                 return False
                 
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"❌ Error cancelling video {video_id}: {e}")
             return False
     
@@ -300,6 +442,6 @@ class EnhancedScheduler:
         """Get video data by ID from database"""
         try:
             return get_video_by_id(video_id)
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"❌ Error getting video {video_id}: {e}")
             return None
@@ -4,9 +4,10 @@ Manages scheduled tasks using APScheduler
 """
 
 import asyncio
+import bisect
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
@@ -17,11 +18,16 @@ logger = logging.getLogger(__name__)
 @dataclass
 class ScheduledJob:
     """Represents a scheduled job"""
+    # No per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('job_id', 'video_id', 'schedule_time', 'schedule_time_iso', 'job_type', 'metadata', 'callback')
+    
     job_id: str
     video_id: int
     schedule_time: datetime
+    schedule_time_iso: str  # Formatted once for listings
     job_type: str
     metadata: Dict[str, Any]
+    callback: Optional[Callable]  # No default: a class-level default would clash with __slots__
 
 class JobScheduler:
     """
@@ -31,10 +37,22 @@ class JobScheduler:
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
         self.scheduled_jobs: Dict[str, ScheduledJob] = {}
-        self.job_callbacks: Dict[str, callable] = {}
+        # (schedule_time, job_id) pairs kept sorted so listings need no sort pass
+        self._by_time: List[Tuple[datetime, str]] = []
         
         logger.info("📅 Job Scheduler initialized")
     
+    def _index_job(self, job: ScheduledJob):
+        """Insert a job into the time-ordered index."""
+        bisect.insort(self._by_time, (job.schedule_time, job.job_id))
+    
+    def _unindex_job(self, job: ScheduledJob):
+        """Remove a job from the time-ordered index."""
+        key = (job.schedule_time, job.job_id)
+        index = bisect.bisect_left(self._by_time, key)
+        if index < len(self._by_time) and self._by_time[index] == key:
+            del self._by_time[index]
+    
     async def start(self):
         """Start the scheduler"""
         try:
@@ -81,18 +99,18 @@ class JobScheduler:
                 job_id=job_id,
                 video_id=job_data.video_id,
                 schedule_time=job_data.schedule_time,
+                schedule_time_iso=job_data.schedule_time.isoformat(),
                 job_type="video_generation",
                 metadata={
                     'title': getattr(job_data, 'title', 'Unknown'),
                     'description': getattr(job_data, 'description', ''),
                     'genre': getattr(job_data, 'genre', 'Unknown')
-                }
+                },
+                callback=callback
             )
             
             self.scheduled_jobs[job_id] = scheduled_job
-            
-            if callback:
-                self.job_callbacks[job_id] = callback
+            self._index_job(scheduled_job)
             
             logger.info(f"📅 Scheduled job {job_id} for {job_data.schedule_time}")
             
@@ -105,14 +123,12 @@ class JobScheduler:
         try:
             logger.info(f"🎬 Executing scheduled job {job_id} for video {video_id}")
             
-            # Execute callback if registered
-            if job_id in self.job_callbacks:
-                callback = self.job_callbacks.pop(job_id)
-                await callback(video_id)
-            
-            # Remove from scheduled jobs
-            if job_id in self.scheduled_jobs:
-                del self.scheduled_jobs[job_id]
+            # Remove from scheduled jobs and execute its callback if registered
+            job = self.scheduled_jobs.pop(job_id, None)
+            if job:
+                self._unindex_job(job)
+                if job.callback:
+                    await job.callback(video_id)
             
             logger.info(f"✅ Scheduled job {job_id} completed")
             
@@ -122,12 +138,10 @@ class JobScheduler:
     async def cancel_job(self, job_id: str):
         """Cancel a scheduled job"""
         try:
-            if job_id in self.scheduled_jobs:
+            job = self.scheduled_jobs.pop(job_id, None)
+            if job:
+                self._unindex_job(job)
                 self.scheduler.remove_job(job_id)
-                del self.scheduled_jobs[job_id]
-                
-                if job_id in self.job_callbacks:
-                    del self.job_callbacks[job_id]
                 
                 logger.info(f"🚫 Cancelled scheduled job {job_id}")
                 return True
@@ -161,23 +175,21 @@ class JobScheduler:
     
     def get_scheduled_jobs(self) -> List[Dict[str, Any]]:
         """Get list of all scheduled jobs"""
-        try:
-            jobs = []
-            for job_id, job in self.scheduled_jobs.items():
-                jobs.append({
-                    'job_id': job_id,
-                    'video_id': job.video_id,
-                    'schedule_time': job.schedule_time.isoformat(),
-                    'job_type': job.job_type,
-                    'metadata': job.metadata,
-                    'time_until_execution': (job.schedule_time - datetime.now()).total_seconds()
-                })
-            
-            return sorted(jobs, key=lambda x: x['schedule_time'])
-            
-        except Exception as e:
-            logger.error(f"❌ Error getting scheduled jobs: {e}")
-            return []
+        now = datetime.now()
+        jobs = []
+        # _by_time is already in schedule order
+        for schedule_time, job_id in self._by_time:
+            job = self.scheduled_jobs[job_id]
+            jobs.append({
+                'job_id': job_id,
+                'video_id': job.video_id,
+                'schedule_time': job.schedule_time_iso,
+                'job_type': job.job_type,
+                'metadata': job.metadata,
+                'time_until_execution': (schedule_time - now).total_seconds()
+            })
+        
+        return jobs
     
     def get_job_count(self) -> int:
         """Get total number of scheduled jobs"""
@@ -190,34 +202,19 @@ class JobScheduler:
     async def reschedule_job(self, job_id: str, new_schedule_time: datetime):
         """Reschedule a job to a new time"""
         try:
-            if job_id in self.scheduled_jobs:
-                # Cancel existing job
-                await self.cancel_job(job_id)
-                
-                # Get original job data
-                original_job = self.scheduled_jobs.get(job_id)
-                if original_job:
-                    # Create new job data
-                    from src.core.workflow_controller import VideoJob
-                    new_job_data = VideoJob(
-                        video_id=original_job.video_id,
-                        title=original_job.metadata.get('title', 'Unknown'),
-                        description=original_job.metadata.get('description', ''),
-                        genre=original_job.metadata.get('genre', 'Unknown'),
-                        expected_length=0,  # Will be filled from database
-                        schedule_time=new_schedule_time,
-                        status=None,  # Will be set by workflow controller
-                        created_at=datetime.now(),
-                        metadata={}
-                    )
-                    
-                    # Schedule new job
-                    await self.schedule_job(new_job_data)
-                    
-                    logger.info(f"📅 Rescheduled job {job_id} to {new_schedule_time}")
-                    return True
+            job = self.scheduled_jobs.get(job_id)
+            if not job:
+                return False
             
-            return False
+            # Move the existing APScheduler job in place; its id and callback are kept
+            self.scheduler.reschedule_job(job_id, trigger=DateTrigger(run_date=new_schedule_time))
+            self._unindex_job(job)
+            job.schedule_time = new_schedule_time
+            job.schedule_time_iso = new_schedule_time.isoformat()
+            self._index_job(job)
+            
+            logger.info(f"📅 Rescheduled job {job_id} to {new_schedule_time}")
+            return True
             
         except Exception as e:
             logger.error(f"❌ Error rescheduling job {job_id}: {e}")
@@ -4,31 +4,180 @@ Handles video uploads to YouTube using YouTube Data API v3
 """
 
 import os
+import mmap
+import pickle
+import hashlib
 import logging
+import mimetypes
+import random
+import threading
+import http.client
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Tuple
 import asyncio
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
-import pickle
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+import google_auth_httplib2
+import httplib2
+
+from ..config.settings import YOUTUBE_UPLOAD_CHUNK_SIZE
+from ..utils.file_utils import FileUtils
 
 logger = logging.getLogger(__name__)
 
+# Authorized user credentials saved between runs
+TOKEN_PATH = 'token.json'
+# Pickled credentials written by earlier versions, migrated to TOKEN_PATH on first use
+LEGACY_TOKEN_PATH = 'token.pickle'
+
+# Resumable upload chunks must be a multiple of 256KB
+UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+
+# Transient upload failures are retried with exponential backoff and jitter
+MAX_UPLOAD_RETRIES = 10
+MAX_RETRY_DELAY = 64
+RETRIABLE_STATUS_CODES = (500, 502, 503, 504)
+RETRIABLE_EXCEPTIONS = (httplib2.HttpLib2Error, IOError, http.client.HTTPException)
+
+# Status codes for a resumable session the server has already discarded
+EXPIRED_SESSION_STATUS_CODES = (404, 410)
+
+# videos.list accepts at most 50 comma-separated IDs per call
+MAX_VIDEOS_PER_LIST = 50
+
+# Sub-requests sent per multipart batch request
+MAX_REQUESTS_PER_BATCH = 50
+
+async def _run_blocking(fn: Callable, *args):
+    """Run a blocking API call in the default executor so HTTP round-trips never stall the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+def _upload_state_path(video_path: str) -> str:
+    """Return the sidecar file recording the resumable session of a video upload"""
+    directory, basename = os.path.split(os.path.abspath(video_path))
+    return os.path.join(directory, f".upload_state_{basename}.json")
+
+def _save_token(credentials) -> None:
+    """Atomically write authorized user credentials to TOKEN_PATH as JSON"""
+    tmp_path = f"{TOKEN_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as token:
+        token.write(credentials.to_json())
+    os.replace(tmp_path, TOKEN_PATH)
+
+def _migrate_legacy_token() -> None:
+    """Convert a token.pickle from an earlier version to TOKEN_PATH once, so existing installs skip the OAuth flow"""
+    if os.path.exists(TOKEN_PATH) or not os.path.exists(LEGACY_TOKEN_PATH):
+        return
+    
+    # The pickle was written by this application itself, never downloaded
+    with open(LEGACY_TOKEN_PATH, 'rb') as token:
+        credentials = pickle.load(token)
+    _save_token(credentials)
+    os.remove(LEGACY_TOKEN_PATH)
+    logger.info(f"🔁 Migrated {LEGACY_TOKEN_PATH} to {TOKEN_PATH}")
+
+def _apply_video_details(result: Dict[str, Any], video_details: Dict[str, Any]) -> None:
+    """Copy looked-up video details into an upload result"""
+    result.update({
+        'upload_time': video_details.get('publishedAt'),
+        'duration': video_details.get('duration'),
+        'view_count': video_details.get('viewCount', 0),
+        'like_count': video_details.get('likeCount', 0)
+    })
+
+def _file_fingerprint(video_path: str) -> Dict[str, int]:
+    """Identify a file version by size and modification time without reading it"""
+    st = os.stat(video_path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+class _HashingReader:
+    """
+    File wrapper that hashes bytes as the uploader reads them
+
+    Bytes are hashed once, in file order, so re-reads after a chunk retry
+    seeks back are not counted twice.
+    """
+    
+    def __init__(self, fd, algorithm: str = 'sha256'):
+        self._fd = fd
+        self._hash = hashlib.new(algorithm)
+        self._hashed = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        start = self._fd.tell()
+        data = self._fd.read(size)
+        end = start + len(data)
+        if start <= self._hashed < end:
+            self._hash.update(memoryview(data)[self._hashed - start:])
+            self._hashed = end
+        return data
+    
+    def hexdigest(self, size: int) -> Optional[str]:
+        """Return the digest once the first size bytes have all been read, otherwise None"""
+        return self._hash.hexdigest() if self._hashed == size else None
+    
+    def __getattr__(self, name):
+        return getattr(self._fd, name)
+
+class HashingMediaUpload(MediaIoBaseUpload):
+    """
+    MediaFileUpload that hashes the file on the fly while it is uploaded,
+    saving a separate read of the whole file for the integrity digest
+
+    Non-empty files are read through a read-only mmap, so chunks come
+    straight from the page cache rather than through the buffered file layer.
+    """
+    
+    def __init__(self, filename: str, mimetype: Optional[str] = None,
+                 chunksize: int = YOUTUBE_UPLOAD_CHUNK_SIZE, resumable: bool = False,
+                 algorithm: str = 'sha256'):
+        if mimetype is None:
+            mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        self._file = open(filename, 'rb')
+        source = self._file
+        # mmap cannot map an empty file
+        if os.fstat(self._file.fileno()).st_size:
+            source = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                source.madvise(mmap.MADV_SEQUENTIAL)
+        self._reader = _HashingReader(source, algorithm)
+        super().__init__(self._reader, mimetype, chunksize=chunksize, resumable=resumable)
+    
+    def hexdigest(self) -> Optional[str]:
+        """Return the file digest, or None if part of the file was never read (e.g. a resumed upload)"""
+        return self._reader.hexdigest(self.size())
+    
+    def __del__(self):
+        for resource in (getattr(self, '_reader', None), getattr(self, '_file', None)):
+            if resource is not None:
+                resource.close()
+
 class YouTubeUploader:
     """
     Handles YouTube video uploads
     """
     
-    def __init__(self, credentials_path: str = "credentials.json"):
+    # Authorized (service, credentials) pairs shared by every uploader using the same client secrets
+    _service_cache: Dict[str, Tuple[Any, Any]] = {}
+    
+    def __init__(self, credentials_path: str = "credentials.json",
+                 chunk_size: int = YOUTUBE_UPLOAD_CHUNK_SIZE):
+        if chunk_size != -1 and (chunk_size <= 0 or chunk_size % UPLOAD_CHUNK_GRANULARITY):
+            raise ValueError(f"chunk_size must be a positive multiple of {UPLOAD_CHUNK_GRANULARITY} bytes or -1, got {chunk_size}")
+        
         self.credentials_path = credentials_path
+        self.chunk_size = chunk_size  # -1 sends the whole file in a single request
         self.scopes = ['https://www.googleapis.com/auth/youtube.upload']
         self.api_name = 'youtube'
         self.api_version = 'v3'
         self.youtube = None
         self.credentials = None
+        # httplib2.Http is not thread-safe, so each executor thread gets its own authorized connection
+        self._local = threading.local()
         
         logger.info("📤 YouTube Uploader initialized")
     
@@ -40,17 +189,27 @@ class YouTubeUploader:
             True if authentication successful, False otherwise
         """
         try:
+            # Reuse the service another uploader already built; building parses the whole discovery document
+            cached = self._service_cache.get(self.credentials_path)
+            if cached:
+                youtube, credentials = cached
+                if not credentials.valid and credentials.expired and credentials.refresh_token:
+                    await _run_blocking(credentials.refresh, Request())
+                if credentials.valid:
+                    self.youtube, self.credentials = youtube, credentials
+                    return True
+            
             logger.info("🔐 Authenticating with YouTube API...")
             
             # Check if we have valid credentials
-            if os.path.exists('token.pickle'):
-                with open('token.pickle', 'rb') as token:
-                    self.credentials = pickle.load(token)
+            _migrate_legacy_token()
+            if os.path.exists(TOKEN_PATH):
+                self.credentials = Credentials.from_authorized_user_file(TOKEN_PATH, self.scopes)
             
             # If credentials are invalid or expired, refresh them
             if not self.credentials or not self.credentials.valid:
                 if self.credentials and self.credentials.expired and self.credentials.refresh_token:
-                    self.credentials.refresh(Request())
+                    await _run_blocking(self.credentials.refresh, Request())
                 else:
                     # Need to get new credentials
                     if not os.path.exists(self.credentials_path):
@@ -62,18 +221,18 @@ class YouTubeUploader:
                         self.credentials_path, self.scopes
                     )
                     # Use out-of-band flow with manual authorization
-                    self.credentials = flow.run_local_server(port=0, open_browser=False)
+                    self.credentials = await _run_blocking(
+                        lambda: flow.run_local_server(port=0, open_browser=False)
+                    )
                 
                 # Save credentials for next run
-                with open('token.pickle', 'wb') as token:
-                    pickle.dump(self.credentials, token)
+                _save_token(self.credentials)
             
             # Build YouTube service
-            self.youtube = build(
-                self.api_name, 
-                self.api_version, 
-                credentials=self.credentials
+            self.youtube = await _run_blocking(
+                lambda: build(self.api_name, self.api_version, credentials=self.credentials)
             )
+            self._service_cache[self.credentials_path] = (self.youtube, self.credentials)
             
             logger.info("✅ YouTube authentication successful")
             return True
@@ -82,10 +241,23 @@ class YouTubeUploader:
             logger.error(f"❌ YouTube authentication failed: {e}")
             return False
     
+    def _thread_http(self):
+        """Return the calling thread's authorized HTTP connection, creating it on first use"""
+        http = getattr(self._local, 'http', None)
+        if http is None or http.credentials is not self.credentials:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+    
+    async def _execute(self, request):
+        """Execute an API request in the default executor on that thread's own connection"""
+        return await _run_blocking(lambda: request.execute(http=self._thread_http()))
+    
     async def upload_video(self, video_path: str, title: str, description: str,
                           tags: List[str] = None, category: str = "28",  # 28 = Science & Technology
                           privacy_status: str = "private", 
-                          thumbnail_path: Optional[str] = None) -> Dict[str, Any]:
+                          thumbnail_path: Optional[str] = None,
+                          fetch_details: bool = True) -> Dict[str, Any]:
         """
         Upload a video to YouTube
         
@@ -97,6 +269,7 @@ class YouTubeUploader:
             category: YouTube category ID
             privacy_status: Privacy status (private, unlisted, public)
             thumbnail_path: Optional path to thumbnail image
+            fetch_details: Whether to look up the published video's details
             
         Returns:
             Dictionary with upload result
@@ -127,41 +300,60 @@ class YouTubeUploader:
                 }
             }
             
-            # Create media upload object
-            media = MediaFileUpload(
-                video_path, 
-                chunksize=1024*1024,  # 1MB chunks
-                resumable=True
-            )
+            logger.info(f"📦 Upload chunk size: {'whole file' if self.chunk_size == -1 else f'{self.chunk_size / (1024 * 1024):g}MB'}")
             
-            # Start upload
-            upload_request = self.youtube.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=media
-            )
+            upload_request = self._build_upload_request(video_path, body)
             
-            # Monitor upload progress
+            # Rebind the session of an interrupted upload of this exact file so it continues where it stopped
+            state_path = _upload_state_path(video_path)
+            fingerprint = _file_fingerprint(video_path)
+            saved_state = FileUtils.load_json(state_path)
             response = None
-            error = None
+            if saved_state:
+                if saved_state.get('fingerprint') == fingerprint and saved_state.get('uri'):
+                    upload_request.resumable_uri = saved_state['uri']
+                    try:
+                        response = await self._resume_upload(upload_request)
+                        logger.info(f"🔁 Resuming interrupted upload: {title}")
+                    except HttpError as e:
+                        if e.resp.status not in EXPIRED_SESSION_STATUS_CODES:
+                            raise
+                        logger.warning(f"⚠️ Saved upload session expired, restarting upload: {title}")
+                        FileUtils.delete_file(state_path)
+                        saved_state = None
+                        upload_request = self._build_upload_request(video_path, body)
+                else:
+                    FileUtils.delete_file(state_path)
+                    saved_state = None
             
+            # Monitor upload progress
             while response is None:
                 try:
-                    status, response = upload_request.next_chunk()
-                    if status:
-                        progress = int(status.progress() * 100)
-                        logger.info(f"📤 Upload progress: {progress}%")
+                    status, response = await self._next_chunk_with_retry(upload_request)
                 except HttpError as e:
-                    if e.resp.status < 500:
-                        error = e
-                        break
-                    else:
-                        # Retry on server errors
-                        await asyncio.sleep(1)
-                        continue
-            
-            if error:
-                raise error
+                    if not saved_state or e.resp.status not in EXPIRED_SESSION_STATUS_CODES:
+                        raise
+                    logger.warning(f"⚠️ Saved upload session expired, restarting upload: {title}")
+                    FileUtils.delete_file(state_path)
+                    saved_state = None
+                    upload_request = self._build_upload_request(video_path, body)
+                    continue
+                
+                if response is None and not saved_state:
+                    saved_state = {'uri': upload_request.resumable_uri, 'fingerprint': fingerprint, 'path': video_path}
+                    FileUtils.save_json(saved_state, state_path)
+                
+                if status:
+                    progress = int(status.progress() * 100)
+                    logger.info(f"📤 Upload progress: {progress}%")
+            
+            if saved_state:
+                FileUtils.delete_file(state_path)
+            
+            # A resumed upload only read the tail of the file, so hash it separately
+            file_hash = upload_request.resumable.hexdigest()
+            if file_hash is None:
+                file_hash = await _run_blocking(FileUtils.calculate_file_hash, video_path, 'sha256')
             
             if response:
                 video_id = response['id']
@@ -171,20 +363,20 @@ class YouTubeUploader:
                 if thumbnail_path and os.path.exists(thumbnail_path):
                     await self._upload_thumbnail(video_id, thumbnail_path)
                 
-                # Get video details
-                video_details = await self._get_video_details(video_id)
-                
-                return {
+                result = {
                     'success': True,
                     'video_id': video_id,
                     'youtube_url': f"https://www.youtube.com/watch?v={video_id}",
                     'title': title,
                     'privacy_status': privacy_status,
-                    'upload_time': video_details.get('publishedAt'),
-                    'duration': video_details.get('duration'),
-                    'view_count': video_details.get('viewCount', 0),
-                    'like_count': video_details.get('likeCount', 0)
+                    'file_sha256': file_hash
                 }
+                
+                # Get video details
+                if fetch_details:
+                    _apply_video_details(result, await self._get_video_details(video_id))
+                
+                return result
             else:
                 raise RuntimeError("Upload completed but no response received")
                 
@@ -197,6 +389,127 @@ class YouTubeUploader:
                 'title': title
             }
     
+    async def upload_videos(self, items: List[Dict[str, Any]], max_concurrency: int = 3) -> List[Dict[str, Any]]:
+        """
+        Upload several videos concurrently
+        
+        Args:
+            items: upload_video keyword arguments, one dict per video
+            max_concurrency: Maximum number of uploads in flight at once
+            
+        Returns:
+            upload_video results in the same order as items
+        """
+        # Authenticate once up front rather than racing from every upload
+        if not self.youtube and not await self.authenticate():
+            return [
+                {'success': False, 'error': 'Failed to authenticate with YouTube',
+                 'video_path': item.get('video_path'), 'title': item.get('title')}
+                for item in items
+            ]
+        
+        slots = asyncio.Semaphore(max_concurrency)
+        
+        async def upload_one(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with slots:
+                return await self.upload_video(**{**item, 'fetch_details': False})
+        
+        # upload_video reports upload failures itself; only bad arguments (e.g. an unknown key) raise here
+        results = await asyncio.gather(*(upload_one(item) for item in items))
+        
+        # Look the uploaded videos up together instead of one videos.list call each, for items that want details
+        uploaded = [
+            result for item, result in zip(items, results)
+            if result['success'] and item.get('fetch_details', True)
+        ]
+        details = await self._get_videos_details([result['video_id'] for result in uploaded])
+        for result in uploaded:
+            _apply_video_details(result, details.get(result['video_id'], {}))
+        
+        return results
+    
+    def _build_upload_request(self, video_path: str, body: Dict[str, Any]):
+        """
+        Build a resumable videos.insert request for a video file
+        
+        Args:
+            video_path: Path to video file
+            body: Video resource metadata
+            
+        Returns:
+            The insert HttpRequest, not yet started
+        """
+        # Bigger chunks mean fewer HTTPS round-trips; the file is hashed as it is read
+        media = HashingMediaUpload(
+            video_path, 
+            chunksize=self.chunk_size,
+            resumable=True
+        )
+        return self.youtube.videos().insert(
+            part=','.join(body.keys()),
+            body=body,
+            media_body=media
+        )
+    
+    async def _resume_upload(self, upload_request) -> Optional[Dict[str, Any]]:
+        """
+        Ask the server how much of a resumable upload it already holds and continue from there
+        
+        Args:
+            upload_request: Resumable insert request bound to a saved session URI
+            
+        Returns:
+            The inserted video resource if the upload had already finished, otherwise None
+        """
+        # An empty PUT with an unknown-range Content-Range is the documented upload status query
+        headers = {
+            'Content-Length': '0',
+            'Content-Range': f"bytes */{upload_request.resumable.size()}"
+        }
+        resp, content = await _run_blocking(
+            lambda: self._thread_http().request(upload_request.resumable_uri, method='PUT', headers=headers)
+        )
+        
+        if resp.status in (200, 201):
+            return upload_request.postproc(resp, content)
+        if resp.status != 308:
+            raise HttpError(resp, content, uri=upload_request.resumable_uri)
+        
+        # Range is "bytes=0-<last byte received>", and absent if nothing arrived yet
+        received = resp.get('range')
+        upload_request.resumable_progress = int(received.rsplit('-', 1)[1]) + 1 if received else 0
+        return None
+    
+    async def _next_chunk_with_retry(self, upload_request, max_retries: int = MAX_UPLOAD_RETRIES):
+        """
+        Send the next chunk of a resumable upload, retrying transient failures
+        
+        Args:
+            upload_request: Resumable insert request
+            max_retries: Retries before the last error is raised
+            
+        Returns:
+            (status, response) tuple from next_chunk()
+        """
+        attempt = 0
+        while True:
+            try:
+                return await _run_blocking(lambda: upload_request.next_chunk(http=self._thread_http()))
+            except HttpError as e:
+                if e.resp.status not in RETRIABLE_STATUS_CODES:
+                    raise
+                error = e
+            except RETRIABLE_EXCEPTIONS as e:
+                error = e
+            
+            attempt += 1
+            if attempt > max_retries:
+                raise error
+            
+            delay = min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+            logger.warning(f"⚠️ Upload chunk failed ({error}), retry {attempt}/{max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
     async def _upload_thumbnail(self, video_id: str, thumbnail_path: str) -> bool:
         """
         Upload a thumbnail for the video
@@ -225,10 +538,10 @@ class YouTubeUploader:
             # Upload thumbnail
             media = MediaFileUpload(thumbnail_path, resumable=True)
             
-            self.youtube.thumbnails().set(
+            await self._execute(self.youtube.thumbnails().set(
                 videoId=video_id,
                 media_body=media
-            ).execute()
+            ))
             
             logger.info(f"✅ Thumbnail uploaded successfully for video {video_id}")
             return True
@@ -247,27 +560,42 @@ class YouTubeUploader:
         Returns:
             Dictionary with video details
         """
-        try:
-            response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=video_id
-            ).execute()
-            
-            if response['items']:
-                video = response['items'][0]
-                return {
-                    'publishedAt': video['snippet'].get('publishedAt'),
-                    'duration': video['contentDetails'].get('duration'),
-                    'viewCount': int(video['statistics'].get('viewCount', 0)),
-                    'likeCount': int(video['statistics'].get('likeCount', 0)),
-                    'commentCount': int(video['statistics'].get('commentCount', 0))
-                }
-            
-            return {}
+        return (await self._get_videos_details([video_id])).get(video_id, {})
+    
+    async def _get_videos_details(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get detailed information about several uploaded videos
+        
+        Args:
+            video_ids: YouTube video IDs
             
-        except Exception as e:
-            logger.error(f"❌ Failed to get video details: {e}")
-            return {}
+        Returns:
+            Dictionary of video details keyed by video ID; videos that could not be fetched are missing
+        """
+        details = {}
+        
+        for start in range(0, len(video_ids), MAX_VIDEOS_PER_LIST):
+            batch = video_ids[start:start + MAX_VIDEOS_PER_LIST]
+            try:
+                response = await self._execute(self.youtube.videos().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(batch),
+                    maxResults=len(batch)
+                ))
+                
+                for video in response.get('items', []):
+                    details[video['id']] = {
+                        'publishedAt': video['snippet'].get('publishedAt'),
+                        'duration': video['contentDetails'].get('duration'),
+                        'viewCount': int(video['statistics'].get('viewCount', 0)),
+                        'likeCount': int(video['statistics'].get('likeCount', 0)),
+                        'commentCount': int(video['statistics'].get('commentCount', 0))
+                    }
+                
+            except Exception as e:
+                logger.error(f"❌ Failed to get video details: {e}")
+        
+        return details
     
     async def update_video(self, video_id: str, title: str = None, 
                           description: str = None, tags: List[str] = None,
@@ -293,28 +621,10 @@ class YouTubeUploader:
             
             logger.info(f"📝 Updating video {video_id}")
             
-            # Build update body
-            body = {'id': video_id}
-            
-            if any([title, description, tags, category]):
-                body['snippet'] = {}
-                if title:
-                    body['snippet']['title'] = title
-                if description:
-                    body['snippet']['description'] = description
-                if tags:
-                    body['snippet']['tags'] = tags
-                if category:
-                    body['snippet']['categoryId'] = category
-            
-            if privacy_status:
-                body['status'] = {'privacyStatus': privacy_status}
-            
             # Update video
-            self.youtube.videos().update(
-                part=','.join(body.keys()),
-                body=body
-            ).execute()
+            await self._execute(self._build_update_request(
+                video_id, title, description, tags, category, privacy_status
+            ))
             
             logger.info(f"✅ Video {video_id} updated successfully")
             return True
@@ -323,6 +633,105 @@ class YouTubeUploader:
             logger.error(f"❌ Failed to update video {video_id}: {e}")
             return False
     
+    def _build_update_request(self, video_id: str, title: str = None,
+                              description: str = None, tags: List[str] = None,
+                              category: str = None, privacy_status: str = None):
+        """Build a videos.update request touching only the given fields"""
+        body = {'id': video_id}
+        
+        if any([title, description, tags, category]):
+            body['snippet'] = {}
+            if title:
+                body['snippet']['title'] = title
+            if description:
+                body['snippet']['description'] = description
+            if tags:
+                body['snippet']['tags'] = tags
+            if category:
+                body['snippet']['categoryId'] = category
+        
+        if privacy_status:
+            body['status'] = {'privacyStatus': privacy_status}
+        
+        return self.youtube.videos().update(
+            part=','.join(body.keys()),
+            body=body
+        )
+    
+    async def _execute_batch(self, requests: List[Any]) -> List[Optional[Exception]]:
+        """
+        Execute API requests as multipart batches, MAX_REQUESTS_PER_BATCH per HTTP round-trip
+        
+        Args:
+            requests: API requests to execute
+            
+        Returns:
+            The error of each request in order, None for requests that succeeded
+        """
+        errors: List[Optional[Exception]] = [None] * len(requests)
+        
+        def record(request_id, response, exception):
+            errors[int(request_id)] = exception
+        
+        for start in range(0, len(requests), MAX_REQUESTS_PER_BATCH):
+            batch = self.youtube.new_batch_http_request(callback=record)
+            for index in range(start, min(start + MAX_REQUESTS_PER_BATCH, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+            try:
+                await _run_blocking(lambda: batch.execute(http=self._thread_http()))
+            except Exception as e:
+                # The whole batch request failed, so none of its parts ran
+                for index in range(start, min(start + MAX_REQUESTS_PER_BATCH, len(requests))):
+                    errors[index] = e
+        
+        return errors
+    
+    async def batch_update(self, updates: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Update the metadata of several videos in batched requests
+        
+        Args:
+            updates: update_video keyword arguments, one dict per video
+            
+        Returns:
+            Whether each update succeeded, in the same order as updates
+        """
+        if not self.youtube and not await self.authenticate():
+            return [False] * len(updates)
+        
+        logger.info(f"📝 Updating {len(updates)} videos")
+        
+        errors = await self._execute_batch([self._build_update_request(**update) for update in updates])
+        for update, error in zip(updates, errors):
+            if error is not None:
+                logger.error(f"❌ Failed to update video {update['video_id']}: {error}")
+        
+        logger.info(f"✅ Updated {errors.count(None)}/{len(updates)} videos")
+        return [error is None for error in errors]
+    
+    async def batch_delete(self, video_ids: List[str]) -> List[bool]:
+        """
+        Delete several videos from YouTube in batched requests
+        
+        Args:
+            video_ids: YouTube video IDs
+            
+        Returns:
+            Whether each deletion succeeded, in the same order as video_ids
+        """
+        if not self.youtube and not await self.authenticate():
+            return [False] * len(video_ids)
+        
+        logger.info(f"🗑️ Deleting {len(video_ids)} videos")
+        
+        errors = await self._execute_batch([self.youtube.videos().delete(id=video_id) for video_id in video_ids])
+        for video_id, error in zip(video_ids, errors):
+            if error is not None:
+                logger.error(f"❌ Failed to delete video {video_id}: {error}")
+        
+        logger.info(f"✅ Deleted {errors.count(None)}/{len(video_ids)} videos")
+        return [error is None for error in errors]
+    
     async def delete_video(self, video_id: str) -> bool:
         """
         Delete a video from YouTube
@@ -340,7 +749,7 @@ class YouTubeUploader:
             
             logger.info(f"🗑️ Deleting video {video_id}")
             
-            self.youtube.videos().delete(id=video_id).execute()
+            await self._execute(self.youtube.videos().delete(id=video_id))
             
             logger.info(f"✅ Video {video_id} deleted successfully")
             return True
@@ -361,10 +770,10 @@ class YouTubeUploader:
                 if not await self.authenticate():
                     return {}
             
-            response = self.youtube.channels().list(
+            response = await self._execute(self.youtube.channels().list(
                 part='snippet,statistics',
                 mine=True
-            ).execute()
+            ))
             
             if response['items']:
                 channel = response['items'][0]
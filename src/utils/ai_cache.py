@@ -0,0 +1,139 @@
+"""
+Disk-backed cache for AI text improvement results.
+
+Results are stored as JSON under cache_dir, sharded by the first two hex
+characters of the key, so they survive restarts and are shared between
+Streamlit sessions.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "ai")
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 1024
+
+# Approximate entry count per cache directory: scanned once per process, then
+# bumped on each new entry so the shards are only rescanned to evict
+_entry_counts: Dict[str, int] = {}
+
+
+class UncachedResult(Exception):
+    """
+    Raised by a compute_fn to hand back a result that must not be cached.
+
+    cached_call lets it propagate, so outer caches such as st.cache_data skip
+    the result as well; callers read it from the result attribute.
+    """
+
+    def __init__(self, result: Any):
+        super().__init__()
+        self.result = result
+
+
+def _cache_path(fn_name: str, args: Tuple, cache_dir: str) -> str:
+    """Return the file path for a (fn_name, args) cache entry."""
+    key = hashlib.sha256(repr((fn_name, args)).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, key[:2], key)
+
+
+def _prune(cache_dir: str, max_entries: int) -> int:
+    """
+    Evict least recently used entries once the cache grows past max_entries.
+
+    Evicts down to 7/8 of max_entries so the next scan is a batch of writes
+    away, and returns the number of entries kept.
+    """
+    entries = []
+    try:
+        with os.scandir(cache_dir) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    for entry in files:
+                        if entry.is_file() and not entry.name.endswith(".tmp"):
+                            entries.append((entry.stat().st_atime, entry.path))
+    except OSError as e:
+        logger.warning(f"Failed to scan AI cache {cache_dir}: {e}")
+        return 0
+
+    if len(entries) <= max_entries:
+        return len(entries)
+
+    keep = max_entries - max_entries // 8
+    entries.sort()
+    for _, path in entries[:len(entries) - keep]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return keep
+
+
+def _count_new_entry(cache_dir: str, max_entries: int) -> None:
+    """Account for a newly written entry, pruning once the cache grows past max_entries."""
+    count = _entry_counts.get(cache_dir)
+    if count is None or count >= max_entries:
+        count = _prune(cache_dir, max_entries)
+    else:
+        count += 1
+    _entry_counts[cache_dir] = count
+
+
+def cached_call(fn_name: str, args: Tuple, compute_fn: Callable[[], Any],
+                ttl: int = DEFAULT_TTL, cache_dir: str = DEFAULT_CACHE_DIR,
+                max_entries: int = DEFAULT_MAX_ENTRIES) -> Any:
+    """
+    Return a cached JSON-serializable result, computing and storing it on a miss.
+
+    compute_fn may raise UncachedResult to return a result without storing it.
+
+    Args:
+        fn_name: Name of the cached operation, part of the cache key
+        args: Hashable inputs of the operation, part of the cache key
+        compute_fn: Zero-argument callable producing the result on a miss
+        ttl: Entry lifetime in seconds
+        cache_dir: Root directory of the cache
+        max_entries: Number of entries kept before least recently used ones are evicted
+
+    Returns:
+        The cached or freshly computed result
+    """
+    path = _cache_path(fn_name, args, cache_dir)
+    is_new = False
+
+    try:
+        mtime = os.stat(path).st_mtime
+        if time.time() - mtime < ttl:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            # Bump atime on hit so eviction follows last use; mtime keeps tracking the TTL
+            os.utime(path, (time.time(), mtime))
+            return result
+    except FileNotFoundError:
+        is_new = True
+    except (OSError, ValueError):
+        pass
+
+    result = compute_fn()
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+        # Overwriting an expired entry does not grow the cache
+        if is_new:
+            _count_new_entry(cache_dir, max_entries)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Failed to write AI cache entry for {fn_name}: {e}")
+
+    return result
@@ -3,17 +3,57 @@ File utility functions for the Automated Video Generator.
 """
 
 import os
+import re
+import errno
+import mmap
+import fnmatch
+import time
 import shutil
 import hashlib
+import functools
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 import logging
 import mimetypes
 from datetime import datetime
 import json
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _dumps(data: Any, indent: Optional[int]) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed and supports the indent."""
+    # orjson only does compact or 2-space output; json's indent=0 still breaks lines, so it stays on json
+    if orjson is not None and indent in (None, 2):
+        # Passthrough leaves datetimes to default=str, matching the json fallback's format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=indent, default=str, ensure_ascii=False).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+@functools.lru_cache(maxsize=256)
+def _mime_type_for_extension(extension: str) -> str:
+    """Return the MIME type for a lowercased file extension, or 'unknown'."""
+    return mimetypes.guess_type(f"file{extension}")[0] or 'unknown'
+
 class FileUtils:
     """Utility class for file operations."""
     
@@ -47,26 +87,49 @@ class FileUtils:
             Dictionary with file information
         """
         try:
-            if not os.path.exists(file_path):
-                return None
-            
-            stat = os.stat(file_path)
-            file_info = {
-                'path': file_path,
-                'name': os.path.basename(file_path),
-                'size': stat.st_size,
-                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'type': mimetypes.guess_type(file_path)[0] or 'unknown',
-                'extension': Path(file_path).suffix.lower()
-            }
-            
-            return file_info
+            return FileUtils._file_info(file_path, os.stat(file_path))
             
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to get file info for {file_path}: {e}")
             return None
     
+    @staticmethod
+    def _file_info(file_path: str, stat: os.stat_result) -> Dict[str, Any]:
+        """Build a file information dictionary from an already fetched stat result."""
+        extension = os.path.splitext(file_path)[1].lower()
+        return {
+            'path': file_path,
+            'name': os.path.basename(file_path),
+            'size': stat.st_size,
+            'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'type': _mime_type_for_extension(extension),
+            'extension': extension
+        }
+    
+    @staticmethod
+    def _walk_files(directory_path: str, recursive: bool = False,
+                    file_types: List[str] = None) -> Iterator[os.DirEntry]:
+        """
+        Yield the files of a directory as scandir entries.
+        
+        Entries carry their stat result from the directory listing on most
+        filesystems, so callers get file metadata without extra syscalls.
+        """
+        wanted = frozenset(file_types) if file_types else None
+        stack = [directory_path]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        if wanted is None or os.path.splitext(entry.name)[1].lower() in wanted:
+                            yield entry
+    
     @staticmethod
     def get_directory_contents(directory_path: str, recursive: bool = False,
                             file_types: List[str] = None) -> List[Dict[str, Any]]:
@@ -85,30 +148,40 @@ class FileUtils:
             if not os.path.exists(directory_path):
                 return []
             
-            contents = []
-            path_obj = Path(directory_path)
-            
-            if recursive:
-                files = path_obj.rglob('*')
-            else:
-                files = path_obj.iterdir()
-            
-            for file_path in files:
-                if file_path.is_file():
-                    # Filter by file type if specified
-                    if file_types and file_path.suffix.lower() not in file_types:
-                        continue
-                    
-                    file_info = FileUtils.get_file_info(str(file_path))
-                    if file_info:
-                        contents.append(file_info)
-            
-            return contents
+            return [
+                FileUtils._file_info(entry.path, entry.stat())
+                for entry in FileUtils._walk_files(directory_path, recursive, file_types)
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get directory contents for {directory_path}: {e}")
             return []
     
+    @staticmethod
+    def _copy_data(source_path: str, destination_path: str) -> None:
+        """
+        Copy file contents inside the kernel where possible.
+        
+        copy_file_range lets the filesystem share extents (reflink on btrfs/XFS)
+        instead of moving the bytes; shutil.copyfile, which uses sendfile on
+        Linux, covers cross-filesystem copies and other platforms.
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(source_path, 'rb') as src, open(destination_path, 'wb') as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                    raise
+        
+        shutil.copyfile(source_path, destination_path)
+    
     @staticmethod
     def copy_file(source_path: str, destination_path: str, 
                   overwrite: bool = False) -> bool:
@@ -138,7 +211,11 @@ class FileUtils:
                 logger.warning(f"Destination file exists and overwrite is False: {destination_path}")
                 return False
             
-            shutil.copy2(source_path, destination_path)
+            if os.path.isdir(destination_path):
+                destination_path = os.path.join(destination_path, os.path.basename(source_path))
+            
+            FileUtils._copy_data(source_path, destination_path)
+            shutil.copystat(source_path, destination_path)
             logger.info(f"File copied successfully: {source_path} -> {destination_path}")
             return True
             
@@ -243,7 +320,7 @@ class FileUtils:
         
         Args:
             file_path: Path to the file
-            algorithm: Hash algorithm (md5, sha1, sha256)
+            algorithm: Hash algorithm (md5, sha1, sha256, or blake3 if installed)
         
         Returns:
             Hexadecimal hash string if successful, None otherwise
@@ -252,13 +329,24 @@ class FileUtils:
             if not os.path.exists(file_path):
                 return None
             
-            hash_obj = hashlib.new(algorithm)
-            
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                if algorithm == 'blake3':
+                    if blake3 is None:
+                        raise ValueError("blake3 is not installed")
+                    hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                    # mmap cannot map an empty file
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                            hash_obj.update(data)
+                    return hash_obj.hexdigest()
+                
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+                
+                hash_obj = hashlib.new(algorithm)
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
                     hash_obj.update(chunk)
-            
-            return hash_obj.hexdigest()
+                return hash_obj.hexdigest()
             
         except Exception as e:
             logger.error(f"Failed to calculate hash for {file_path}: {e}")
@@ -276,19 +364,14 @@ class FileUtils:
             Formatted size string (e.g., "1.5 MB")
         """
         try:
-            if not os.path.exists(file_path):
-                return "0 B"
-            
-            size_bytes = os.path.getsize(file_path)
+            size_bytes = os.stat(file_path).st_size
             
-            # Convert to appropriate unit
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if size_bytes < 1024.0:
-                    return f"{size_bytes:.1f} {unit}"
-                size_bytes /= 1024.0
-            
-            return f"{size_bytes:.1f} PB"
+            # Each unit is 2**10 times the previous, so the bit length picks it directly
+            exponent = min(max(0, (size_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+            return f"{size_bytes / (1 << (exponent * 10)):.1f} {_SIZE_UNITS[exponent]}"
             
+        except FileNotFoundError:
+            return "0 B"
         except Exception as e:
             logger.error(f"Failed to get file size for {file_path}: {e}")
             return "0 B"
@@ -311,14 +394,18 @@ class FileUtils:
             if not os.path.exists(directory_path):
                 return []
             
-            path_obj = Path(directory_path)
+            # Patterns spanning directories need pathlib's segment-wise matching
+            if '/' in pattern or os.sep in pattern:
+                path_obj = Path(directory_path)
+                files = path_obj.rglob(pattern) if recursive else path_obj.glob(pattern)
+                return [str(f) for f in files if f.is_file()]
             
-            if recursive:
-                files = path_obj.rglob(pattern)
-            else:
-                files = path_obj.glob(pattern)
-            
-            return [str(f) for f in files if f.is_file()]
+            match = re.compile(fnmatch.translate(pattern)).match
+            return [
+                entry.path
+                for entry in FileUtils._walk_files(directory_path, recursive)
+                if match(entry.name)
+            ]
             
         except Exception as e:
             logger.error(f"Failed to find files by pattern in {directory_path}: {e}")
@@ -342,21 +429,17 @@ class FileUtils:
             if not os.path.exists(directory_path):
                 return 0
             
-            cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
+            cutoff_time = time.time() - (max_age_hours * 3600)
             deleted_count = 0
             
-            for file_info in FileUtils.get_directory_contents(directory_path, recursive=True):
-                file_path = file_info['path']
-                
-                # Check file type
-                if file_types and file_info['extension'] not in file_types:
-                    continue
-                
+            for entry in FileUtils._walk_files(directory_path, recursive=True, file_types=file_types):
                 # Check file age
-                file_time = datetime.fromisoformat(file_info['modified']).timestamp()
-                if file_time < cutoff_time:
-                    if FileUtils.delete_file(file_path):
+                if entry.stat().st_mtime < cutoff_time:
+                    try:
+                        os.unlink(entry.path)
                         deleted_count += 1
+                    except OSError as e:
+                        logger.error(f"Failed to delete file {entry.path}: {e}")
             
             logger.info(f"Cleaned up {deleted_count} temporary files from {directory_path}")
             return deleted_count
@@ -384,8 +467,8 @@ class FileUtils:
             if dest_dir and not FileUtils.ensure_directory(dest_dir):
                 return False
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, default=str, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(_dumps(data, indent))
             
             logger.info(f"JSON data saved successfully: {file_path}")
             return True
@@ -409,8 +492,8 @@ class FileUtils:
             if not os.path.exists(file_path):
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _loads(f.read())
             
             logger.info(f"JSON data loaded successfully: {file_path}")
             return data
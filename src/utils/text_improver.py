@@ -11,6 +11,10 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+def _with_source(result: Any, source: str, return_source: bool) -> Any:
+    """Return result, paired with its source when the caller asked for it"""
+    return (result, source) if return_source else result
+
 class TextImprover:
     """
     Enhanced text improver using Google Gemini API for better content enhancement
@@ -42,7 +46,7 @@ class TextImprover:
         else:
             logger.info("⚠️ Google Gemini API key not provided, using fallback methods")
     
-    def improve_title(self, title: str, genre: str, tone: str) -> str:
+    def improve_title(self, title: str, genre: str, tone: str, return_source: bool = False):
         """
         Improve video title using Google Gemini API
         
@@ -50,9 +54,11 @@ class TextImprover:
             title: Original title
             genre: Video genre/category
             tone: Desired tone/style
+            return_source: Also return where the result came from
             
         Returns:
-            Improved title
+            Improved title, or a (result, source) tuple with source one of
+            'gemini', 'fallback' or 'original' when return_source is set
         """
         try:
             if self.gemini_api_key:
@@ -64,18 +70,18 @@ class TextImprover:
                 )
                 if improved_title:
                     logger.info(f"✅ Title improved with Gemini API: {improved_title}")
-                    return improved_title
+                    return _with_source(improved_title, 'gemini', return_source)
             
             # Fallback to basic improvements
             improved_title = self._improve_with_basic_rules(title, genre, tone)
             logger.info(f"✅ Title improved with fallback method: {improved_title}")
-            return improved_title
+            return _with_source(improved_title, 'fallback', return_source)
             
         except Exception as e:
             logger.error(f"❌ Title improvement failed: {e}")
-            return title
+            return _with_source(title, 'original', return_source)
     
-    def improve_description(self, description: str, genre: str, tone: str) -> str:
+    def improve_description(self, description: str, genre: str, tone: str, return_source: bool = False):
         """
         Improve video description using Google Gemini API
         
@@ -83,9 +89,11 @@ class TextImprover:
             description: Original description
             genre: Video genre/category
             tone: Desired tone/style
+            return_source: Also return where the result came from
             
         Returns:
-            Improved description
+            Improved description, or a (result, source) tuple with source one of
+            'gemini', 'fallback' or 'original' when return_source is set
         """
         try:
             if self.gemini_api_key:
@@ -97,18 +105,19 @@ class TextImprover:
                 )
                 if improved_description:
                     logger.info(f"✅ Description improved with Gemini API: {improved_description[:100]}...")
-                    return improved_description
+                    return _with_source(improved_description, 'gemini', return_source)
             
             # Fallback to basic improvements
             improved_description = self._improve_with_basic_rules(description, genre, tone)
             logger.info(f"✅ Description improved with fallback method: {improved_description[:100]}...")
-            return improved_description
+            return _with_source(improved_description, 'fallback', return_source)
             
         except Exception as e:
             logger.error(f"❌ Description improvement failed: {e}")
-            return description
+            return _with_source(description, 'original', return_source)
     
-    def improve_tags(self, tags: List[str], title: str = None, description: str = None, genre: str = None, tone: str = None) -> List[str]:
+    def improve_tags(self, tags: List[str], title: str = None, description: str = None, genre: str = None, tone: str = None,
+                     return_source: bool = False):
         """
         Improve video tags using Google Gemini API
         
@@ -118,9 +127,11 @@ class TextImprover:
             description: Video description
             genre: Video genre/category
             tone: Desired tone/style
+            return_source: Also return where the result came from
             
         Returns:
-            Improved tags list
+            Improved tags list, or a (result, source) tuple with source one of
+            'gemini', 'fallback' or 'original' when return_source is set
         """
         try:
             if self.gemini_api_key:
@@ -133,18 +144,19 @@ class TextImprover:
                 )
                 if improved_tags:
                     logger.info(f"✅ Tags improved with Gemini API: {len(improved_tags)} tags")
-                    return improved_tags
+                    return _with_source(improved_tags, 'gemini', return_source)
             
             # Fallback to basic improvements
             improved_tags = self._improve_tags_with_basic_rules(tags, title, description, genre, tone)
             logger.info(f"✅ Tags improved with fallback method: {len(improved_tags)} tags")
-            return improved_tags
+            return _with_source(improved_tags, 'fallback', return_source)
             
         except Exception as e:
             logger.error(f"❌ Tag improvement failed: {e}")
-            return tags
+            return _with_source(tags, 'original', return_source)
     
-    def improve_all_content(self, title: str, description: str, tags: List[str], genre: str, tone: str) -> Dict[str, Any]:
+    def improve_all_content(self, title: str, description: str, tags: List[str], genre: str, tone: str,
+                            return_source: bool = False):
         """
         Improve all content (title, description, tags) using Google Gemini API
         
@@ -154,9 +166,11 @@ class TextImprover:
             tags: Original tags list
             genre: Video genre/category
             tone: Desired tone/style
+            return_source: Also return where the result came from
             
         Returns:
-            Dictionary with improved title, description, and tags
+            Dictionary with improved title, description, and tags, or a (result, source) tuple with source one of
+            'gemini', 'fallback' or 'original' when return_source is set
         """
         try:
             if self.gemini_api_key:
@@ -169,7 +183,7 @@ class TextImprover:
                 )
                 if improved_content:
                     logger.info("✅ All content improved with Gemini API")
-                    return improved_content
+                    return _with_source(improved_content, 'gemini', return_source)
             
             # Fallback to individual improvements
             improved_title = self.improve_title(title, genre, tone)
@@ -177,19 +191,19 @@ class TextImprover:
             improved_tags = self.improve_tags(tags, title, description, genre, tone)
             
             logger.info("✅ All content improved with fallback methods")
-            return {
+            return _with_source({
                 'title': improved_title,
                 'description': improved_description,
                 'tags': improved_tags
-            }
+            }, 'fallback', return_source)
             
         except Exception as e:
             logger.error(f"❌ All content improvement failed: {e}")
-            return {
+            return _with_source({
                 'title': title,
                 'description': description,
                 'tags': tags
-            }
+            }, 'original', return_source)
     
     def _improve_with_gemini(self, content_type: str, original_text: str, genre: str, tone: str) -> Optional[str]:
         """